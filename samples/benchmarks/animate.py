@@ -0,0 +1,25 @@
+'''
+Measures starting 1000 two second fades and the time Ursina._update spends per frame while they run, not counting rendering.
+'''
+from ursina import *
+
+
+application.trace_entity_definition = False
+app = Ursina(headless=True)
+window.fps_counter.enabled = False
+
+entities = [Entity(model='quad') for i in range(1000)]
+
+t = time.perf_counter()
+for e in entities:
+    e.fade_out(duration=2)
+    e.animate_position((1,2,3), duration=2)
+print(f'start 2000 animations: {(time.perf_counter() - t) * 1000:.2f} ms')
+
+app.step(1, dt=1/60)    # fixed dt, so the animations don't finish during the measurement
+t = time.perf_counter()
+for i in range(60):
+    app._update(None)
+print(f'ms per Ursina._update while animating: {(time.perf_counter() - t) / 60 * 1000:.2f}')
+
+application.quit()
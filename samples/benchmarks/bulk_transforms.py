@@ -0,0 +1,49 @@
+'''
+Compares setting and reading the positions of 5000 entities one by one with scene.set_transforms() and scene.get_positions().
+'''
+from ursina import *
+import numpy
+
+
+application.trace_entity_definition = False
+app = Ursina(headless=True)
+window.fps_counter.enabled = False
+
+n = 5000
+entities = [Entity() for i in range(n)]
+positions = numpy.random.uniform(-10, 10, (n,3)).astype(numpy.float32)
+rotations = numpy.random.uniform(-180, 180, (n,3)).astype(numpy.float32)
+
+
+def per_entity():
+    for e, p in zip(entities, positions):
+        e.position = Vec3(*p)
+
+def per_entity_list():
+    for e, p in zip(entities, positions.tolist()):
+        e.position = p
+
+def bulk():
+    scene.set_transforms(entities, positions=positions)
+
+def bulk_position_rotation_scale():
+    scene.set_transforms(entities, positions=positions, rotations=rotations, scales=positions)
+
+def get_per_entity():
+    return numpy.array([e.position for e in entities])
+
+def get_bulk():
+    return scene.get_positions(entities)
+
+
+print(f'ms for {n} entities')
+for test in (per_entity, per_entity_list, bulk, bulk_position_rotation_scale, get_per_entity, get_bulk):
+    t = time.perf_counter()
+    for i in range(10):
+        test()
+    print(f'{test.__name__:<30}{(time.perf_counter() - t) / 10 * 1000:8.2f}')
+
+scene.set_transforms(entities, positions=positions, rotations=rotations)
+print('round trip ok:', numpy.allclose(scene.get_positions(entities), positions, atol=1e-4),
+    numpy.allclose(numpy.array([e.rotation for e in entities]), scene.get_rotations(entities), atol=1e-3))
+application.quit()
@@ -0,0 +1,38 @@
+'''
+Compares moving 10k Entities one by one with moving 10k elements of an EntityArray with numpy.
+'''
+from ursina import *
+import numpy
+
+
+application.trace_entity_definition = False
+app = Ursina(headless=True)
+window.fps_counter.enabled = False
+
+n = 10000
+entities = [Entity(model='quad', scale=.1) for i in range(n)]
+array = EntityArray(model='quad', count=n, scales=numpy.full((n,3), .1, dtype=numpy.float32))
+velocities = numpy.random.uniform(-1, 1, (n,3)).astype(numpy.float32)
+
+
+def move_entities():
+    for e, v in zip(entities, velocities.tolist()):
+        e.position += Vec3(*v) * .016
+
+def move_entity_array():
+    array.positions += velocities * .016
+    array.apply()
+
+def rotate_entity_array():
+    array.rotations[:, 1] += 1
+    array.apply()
+
+
+print(f'ms for {n}')
+for test in (move_entities, move_entity_array, rotate_entity_array):
+    t = time.perf_counter()
+    for i in range(10):
+        test()
+    print(f'{test.__name__:<22}{(time.perf_counter() - t) / 10 * 1000:8.2f}')
+
+application.quit()
@@ -0,0 +1,38 @@
+'''
+Compares creating and destroying short lived entities with reusing them through an EntityPool.
+'''
+from ursina import *
+
+
+application.trace_entity_definition = False
+app = Ursina(headless=True)
+window.fps_counter.enabled = False
+
+
+class Bullet(Entity):
+    def __init__(self):
+        super().__init__(model='cube', scale=.1, collider='box')
+
+    def update(self):
+        self.z += time.dt
+
+
+def spawn_and_destroy(n):
+    for e in [Bullet() for i in range(n)]:
+        destroy(e)
+
+pool = EntityPool(Bullet, size=100)
+def get_and_release(n):
+    for e in [pool.get(x=i) for i in range(n)]:
+        pool.release(e)
+
+
+print('ms per 100 bullets')
+for test in (spawn_and_destroy, get_and_release):
+    t = time.perf_counter()
+    for i in range(10):
+        test(100)
+    print(f'{test.__name__:<18}{(time.perf_counter() - t) / 10 * 1000:8.2f}')
+
+print('bullets in update_registry while idle:', len([e for e in scene.update_registry if isinstance(e, Bullet)]))
+application.quit()
@@ -0,0 +1,36 @@
+'''
+Compares scene.find_all() with scanning scene.entities, and times raycast(), with 10k entities in the scene.
+'''
+from ursina import *
+
+
+application.trace_entity_definition = False
+app = Ursina(headless=True)
+window.fps_counter.enabled = False
+
+class Enemy(Entity):
+    pass
+
+entities = [Entity(name=f'entity_{i}') for i in range(10000)]
+for i in range(0, 10000, 100):
+    Enemy(name='enemy').add_tag('enemy')
+wall = Entity(model='cube', collider='box', z=5)
+
+
+def timed(name, function, n=100):
+    t = time.perf_counter()
+    for i in range(n):
+        function()
+    print(f'{name:<28}{(time.perf_counter() - t) / n * 1000000:10.1f}')
+
+
+print('us per call')
+timed('scan by name', lambda: [e for e in scene.entities if e.name == 'enemy'], n=10)
+timed('find_all(name=...)', lambda: scene.find_all(name='enemy'))
+timed('scan by type', lambda: [e for e in scene.entities if isinstance(e, Enemy)], n=10)
+timed('find_all(type=...)', lambda: scene.find_all(type=Enemy))
+timed('find_all(tag=...)', lambda: scene.find_all(tag='enemy'))
+timed('find(name=...)', lambda: scene.find(name='entity_5000'))
+timed('raycast', lambda: raycast((0,0,0), (0,0,1)))
+
+application.quit()
@@ -0,0 +1,58 @@
+'''
+Measures building hierarchies of 10k entities and looking up children and ancestors in them.
+'wide' parents every entity to one root, 'deep' builds chains of 100 where every entity is parented to the previous one.
+Longer chains mostly measure panda3d's reparentTo, which gets slower with depth.
+'''
+from ursina import *
+
+
+application.trace_entity_definition = False
+app = Ursina(headless=True)
+window.fps_counter.enabled = False
+
+
+def timed(function):
+    t = time.perf_counter()
+    result = function()
+    return (time.perf_counter() - t) * 1000, result
+
+
+def build_wide(n):
+    root = Entity()
+    for i in range(n):
+        Entity(parent=root)
+    return root
+
+def build_deep(n, depth=100):
+    root = Entity()
+    for chain in range(n // depth):
+        e = root
+        for i in range(depth):
+            e = Entity(parent=e)
+    return root, e
+
+
+n = 10000
+print(f'{n} entities, in ms')
+
+ms, root = timed(lambda: build_wide(n))
+print(f'{"build wide":<28}{ms:8.2f}')
+ms, children = timed(lambda: root.children)
+print(f'{"children of wide root":<28}{ms:8.2f}  ({len(children)} children)')
+ms, _ = timed(lambda: [e.parent for e in children])
+print(f'{"parent of every child":<28}{ms:8.2f}')
+ms, _ = timed(lambda: [e.children for e in children[:1000]])
+print(f'{"children of 1000 leafs":<28}{ms:8.2f}')
+ms, _ = timed(lambda: [setattr(e, 'world_parent', scene) for e in children])
+print(f'{"world_parent to scene":<28}{ms:8.2f}')
+ms, _ = timed(lambda: [destroy(e) for e in children] + [destroy(root)])
+print(f'{"destroy wide":<28}{ms:8.2f}')
+
+ms, (root, leaf) = timed(lambda: build_deep(n))
+print(f'{"build deep":<28}{ms:8.2f}')
+ms, result = timed(lambda: [leaf.has_ancestor(root) for i in range(1000)])
+print(f'{"has_ancestor(root)x1000":<28}{ms:8.2f}  ({result[0]})')
+ms, result = timed(lambda: [leaf.has_ancestor('Camera') for i in range(1000)])
+print(f'{"has_ancestor(missing)x1000":<28}{ms:8.2f}  ({result[0]})')
+
+application.quit()
@@ -0,0 +1,38 @@
+'''
+Compares 4096 cubes as separate Entities and as one Instancer: the time to make them, the time to move all of them,
+and the number of nodes panda has to cull and draw each frame.
+'''
+import time
+import numpy
+from ursina import *
+
+
+application.trace_entity_definition = False
+app = Ursina(headless=True)
+window.fps_counter.enabled = False
+positions = [(x, 0, z) for z in range(64) for x in range(64)]
+
+t = time.perf_counter()
+entities = [Entity(model='cube', position=p, collider='box') for p in positions]
+print(f'4096 entities:   make: {(time.perf_counter() - t) * 1000:7.1f} ms', end='   ')
+t = time.perf_counter()
+for e in entities:
+    e.y = math.sin(e.x * .2)
+print(f'move all: {(time.perf_counter() - t) * 1000:6.2f} ms   nodes: {render.count_num_descendants()}')
+for e in entities:
+    destroy(e)
+
+t = time.perf_counter()
+blocks = Instancer(model='cube', instance_collider='box')
+for p in positions:
+    blocks.add(position=p)
+print(f'Instancer:       make: {(time.perf_counter() - t) * 1000:7.1f} ms', end='   ')
+t = time.perf_counter()
+blocks.positions[:, 1] = numpy.sin(blocks.positions[:, 0] * .2)
+blocks.apply()
+print(f'move all: {(time.perf_counter() - t) * 1000:6.2f} ms   nodes: {render.count_num_descendants()} (one draw call)')
+
+hit = raycast((10, 10, 10), (0, -1, 0))
+print('raycast hit:', hit.entity, hit.instance, blocks.instances[10 * 64 + 10])
+
+application.quit()
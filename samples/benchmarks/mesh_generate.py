@@ -0,0 +1,37 @@
+'''
+Measures Mesh.generate() for a grid with 10k, 100k and 1M vertices, with colors, uvs and normals,
+given as lists of tuples and as numpy arrays. numpy arrays get copied into the vertex buffer all at once.
+'''
+import time
+import numpy
+from ursina import *
+
+
+application.trace_entity_definition = False
+app = Ursina(headless=True)
+
+def grid(size):
+    x, z = numpy.meshgrid(numpy.arange(size, dtype=numpy.float32), numpy.arange(size, dtype=numpy.float32))
+    vertices = numpy.stack((x.ravel(), numpy.sin(x.ravel() * .1) * numpy.cos(z.ravel() * .1), z.ravel()), axis=1)
+    colors = numpy.random.random((size * size, 4)).astype(numpy.float32)
+    uvs = vertices[:, (0,2)] / size
+    normals = numpy.tile(numpy.float32((0,1,0)), (size * size, 1))
+    i = numpy.arange(size * size).reshape(size, size)[:-1, :-1].ravel()
+    triangles = numpy.stack((i, i + size, i + size + 1, i, i + size + 1, i + 1), axis=1).reshape(-1, 3)
+    return vertices, triangles, colors, uvs, normals
+
+
+for size in (100, 317, 1000):
+    arrays = grid(size)
+    lists = [[tuple(e) for e in a.tolist()] for a in arrays]
+    m = Mesh()
+    results = list()
+    for name, data in (('lists', lists), ('numpy', arrays)):
+        m.vertices, m.triangles, m.colors, m.uvs, m.normals = data
+        t = time.perf_counter()
+        m.generate()
+        results.append(f'{name}: {(time.perf_counter() - t) * 1000:8.1f} ms')
+
+    print(f'{size*size:8} vertices, {len(arrays[1]):8} triangles   ', '   '.join(results))
+
+application.quit()
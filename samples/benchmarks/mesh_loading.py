@@ -0,0 +1,39 @@
+'''
+Compares load_model() for a model with 50k triangles, with uvs and normals, saved as .ursinamesh (python code that gets evaluated)
+and as .npz (numpy arrays that get copied into the vertex buffer).
+'''
+import time
+import tempfile
+import numpy
+from ursina import *
+from ursina.mesh_importer import load_model
+
+
+application.trace_entity_definition = False
+app = Ursina(headless=True)
+
+size = 159    # 158*158*2 = 50k triangles
+x, z = numpy.meshgrid(numpy.arange(size, dtype=numpy.float32), numpy.arange(size, dtype=numpy.float32))
+i = numpy.arange(size * size).reshape(size, size)[:-1, :-1].ravel()
+triangles = numpy.stack((i, i + size, i + size + 1, i, i + size + 1, i + 1), axis=1).reshape(-1, 3)
+vertices = numpy.stack((x.ravel(), numpy.sin(x.ravel() * .1), z.ravel()), axis=1)[triangles.ravel()]   # unindexed, like models converted from .obj
+mesh = Mesh(vertices=vertices.tolist(), uvs=(vertices[:, (0,2)] / size).tolist(), normals=[(0,1,0)] * len(vertices))
+
+folder = Path(tempfile.mkdtemp())
+mesh.save('terrain', path=folder)
+mesh.save('terrain_binary', path=folder, filetype='npz')
+for name in ('terrain.ursinamesh', 'terrain_binary.npz'):
+    print(f'{name:20} {(folder / name).stat().st_size / 1e6:6.2f} MB')
+
+del mesh    # so the garbage collector doesn't have to go through its lists while timing
+import gc
+gc.collect()
+
+for name in ('terrain', 'terrain_binary'):
+    t = time.perf_counter()
+    m = load_model(name, folder)
+    print(f'load_model({name!r}): {(time.perf_counter() - t) * 1000:.1f} ms, {len(m.vertices)} vertices')
+    del m
+    gc.collect()
+
+application.quit()
@@ -0,0 +1,47 @@
+'''
+Measures the time Ursina._update spends per frame on 1000 running sequences of 500 steps each.
+'''
+from ursina import *
+
+
+application.trace_entity_definition = False
+app = Ursina(headless=True)
+window.fps_counter.enabled = False
+
+calls = 0
+def step():
+    global calls
+    calls += 1
+
+
+sequences = list()
+for i in range(1000):
+    s = Sequence(loop=True)
+    for j in range(500):
+        s.append(Func(step))
+        s.append(Wait(.01))
+    sequences.append(s)
+
+t = time.perf_counter()
+for s in sequences:
+    s.start()
+print(f'start 1000 sequences: {(time.perf_counter() - t) * 1000:.2f} ms')
+
+app.step(1, dt=1/60)    # fixed dt
+calls = 0
+t = time.perf_counter()
+for i in range(60):
+    app._update(None)
+print(f'ms per Ursina._update: {(time.perf_counter() - t) / 60 * 1000:.2f}  ({calls / 60:.0f} funcs called per frame)')
+
+# jumping far ahead still calls every func that's due, in order
+called = list()
+s = Sequence(time_step=5)
+for i in range(10000):
+    s.append(Func(called.append, i))
+    s.append(Wait(.001))
+s.start()
+s.update()
+print('funcs called after jumping 5 seconds ahead:', len(called), 'in order:', called == sorted(called))
+
+application.quit()
@@ -0,0 +1,34 @@
+'''
+Measures the time per attribute assignment on 10k entities, for the kinds of assignments update() code does every frame.
+
+Setting enabled to the value it already has, before and after _set_enabled returned early for it:
+    enabled             ~15000 ns  ->  ~270 ns
+    toggle_enabled      ~12500 ns  ->  ~12500 ns    (still stashes and refreshes the update and input registries)
+'''
+from ursina import *
+
+
+application.trace_entity_definition = False
+app = Ursina(headless=True)
+window.fps_counter.enabled = False
+
+entities = [Entity(counter=0) for i in range(10000)]
+v = Vec3(1,2,3)
+
+
+def position(e): e.position = v
+def x(e): e.x += .1
+def custom_attribute(e): e.counter += 1
+def enabled(e): e.enabled = True       # already enabled, so there's nothing to do
+def toggle_enabled(e): e.enabled = not e.enabled
+
+
+print('ns per assignment')
+for test in (position, x, custom_attribute, enabled, toggle_enabled):
+    t = time.perf_counter()
+    for i in range(10):
+        for e in entities:
+            test(e)
+    print(f'{test.__name__:<18}{(time.perf_counter() - t) / (10 * len(entities)) * 1e9:8.0f}')
+
+application.quit()
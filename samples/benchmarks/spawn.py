@@ -0,0 +1,38 @@
+'''
+Measures how many entities can be created per second, with and without application.trace_entity_definition.
+Voxel is like the one in samples/minecraft_clone.py, but without model and texture,
+since looking those up on disk would take most of the time.
+'''
+from ursina import *
+
+
+app = Ursina(headless=True)
+window.fps_counter.enabled = False
+
+
+class Voxel(Button):
+    def __init__(self, position=(0,0,0)):
+        super().__init__(
+            parent = scene,
+            position = position,
+            origin_y = .5,
+            color = color.color(0, 0, random.uniform(.9, 1.0)),
+            highlight_color = color.lime,
+        )
+
+
+def spawn_rate(prefab, n=10000):
+    t = time.perf_counter()
+    entities = [prefab() for i in range(n)]
+    rate = n / (time.perf_counter() - t)
+    for e in entities:
+        destroy(e)
+    return rate
+
+
+print('trace_entity_definition | Entity/s | Voxel/s')
+for trace in (False, True):
+    application.trace_entity_definition = trace
+    print(f'{str(trace):>23} | {spawn_rate(Entity):>8.0f} | {spawn_rate(Voxel):>7.0f}')
+
+application.quit()
@@ -0,0 +1,43 @@
+'''
+Measures the cost of 10000 pending invoke(delay=...) calls: scheduling them, frames where none are due,
+and cancelling them. Also checks they respect application.paused and application.time_scale.
+'''
+from ursina import *
+
+
+application.trace_entity_definition = False
+app = Ursina(headless=True)
+window.fps_counter.enabled = False
+
+calls = 0
+def step():
+    global calls
+    calls += 1
+
+
+t = time.perf_counter()
+pending = [invoke(step, delay=10 + random.random() * 100) for i in range(10000)]
+print(f'invoke 10000 delayed calls: {(time.perf_counter() - t) * 1000:.2f} ms')
+
+app.step(1, dt=1/60)    # fixed dt
+t = time.perf_counter()
+for i in range(60):
+    app._update(None)
+print(f'ms per Ursina._update with nothing due: {(time.perf_counter() - t) / 60 * 1000:.2f}  ({calls} called)')
+
+t = time.perf_counter()
+for e in pending:
+    e.kill()
+print(f'cancel 10000 delayed calls: {(time.perf_counter() - t) * 1000:.2f} ms')
+
+# paused: nothing fires. time_scale=2: a 1 second delay fires after half a second of real time.
+invoke(step, delay=1)
+application.paused = True
+app.step(60, dt=1/30)
+print('called while paused:', calls)
+application.paused = False
+application.time_scale = 2
+app.step(16, dt=1/30)
+print('called after .53 seconds at time_scale 2:', calls)
+
+application.quit()
@@ -0,0 +1,35 @@
+'''
+Measures the time Ursina._update spends per frame for a growing number of entities.
+Most of the entities are static, only a few of them have an update function,
+which is the common case for bigger scenes.
+'''
+from ursina import *
+
+
+application.trace_entity_definition = False
+app = Ursina(headless=True)
+window.fps_counter.enabled = False
+
+
+class Spinner(Entity):
+    def update(self):
+        self.rotation_y += 1
+
+
+def frame_time(frames=100):
+    t = time.perf_counter()
+    for i in range(frames):
+        app._update(None)
+    return (time.perf_counter() - t) / frames
+
+
+print('entities | updating | ms per frame')
+spawned = list()
+for n in (1000, 5000, 10000, 20000):
+    for e in spawned:
+        destroy(e)
+
+    spawned = [Spinner() if i % 100 == 0 else Entity() for i in range(n)]
+    print(f'{n:>8} | {len(scene.update_registry):>8} | {frame_time() * 1000:.3f}')
+
+application.quit()
@@ -1,3 +1,3 @@
 import ursina
 
-app = ursina.Ursina(init_showbase=True)
+app = ursina.Ursina(init_showbase=True, headless=True)
@@ -0,0 +1,9 @@
+import pytest
+
+
+@pytest.fixture(scope='session')
+def app():
+    # ShowBase can only be made once per process, so all the tests share one headless app
+    from ursina import Ursina, application
+    application.trace_entity_definition = False
+    return Ursina(headless=True)
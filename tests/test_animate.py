@@ -0,0 +1,19 @@
+from ursina import Entity
+
+
+def test_animate_position_returns_one_animator_per_axis(app):
+    e = Entity()
+    x, y, z = e.animate_position((1,2,3), duration=.1)
+    assert (x.name, y.name, z.name) == ('x', 'y', 'z')
+    assert e.animate_position((1,2), duration=.1)[2] is None
+    assert [a.name for a in e.animate_rotation((0,90,0), duration=.1)] == ['rotation_x', 'rotation_y', 'rotation_z']
+
+
+def test_animate_x_interrupts_animate_position(app):
+    e = Entity()
+    x, y, z = e.animate_position((1,2,3), duration=.1)
+    new_x = e.animate_x(-1, duration=.1)
+    assert x not in e.animations and new_x in e.animations
+
+    app.step(12, dt=1/60)
+    assert tuple(round(v, 4) for v in e.position) == (-1, 2, 3)
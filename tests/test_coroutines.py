@@ -0,0 +1,28 @@
+from ursina import Entity, scene, start_coroutine, wait, next_frame, until
+
+
+def test_scene_clear_cancels_coroutines(app):
+    e = Entity()
+    frames = list()
+
+    async def move():
+        while True:
+            e.x += 1
+            frames.append(e.x)
+            await next_frame()
+
+    async def wait_a_while():
+        await wait(10)
+
+    async def wait_forever():
+        await until(lambda: False)
+
+    tasks = [start_coroutine(move()), start_coroutine(wait_a_while()), start_coroutine(wait_forever())]
+    app.step(3, dt=1/60)
+    assert frames and not any(t.done() for t in tasks)
+
+    scene.clear()
+    count = len(frames)
+    app.step(3, dt=1/60)
+    assert len(frames) == count
+    assert all(t.cancelled() for t in tasks)
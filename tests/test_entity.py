@@ -0,0 +1,29 @@
+from ursina import Entity
+
+
+def test_subclasses_can_override_setters(app):
+    class Colored(Entity):
+        def _set_color(self, name, value):
+            self.colors_set = getattr(self, 'colors_set', 0) + 1
+            super()._set_color(name, value)
+
+    e = Colored()
+    before = e.colors_set
+    e.color = (1,0,0,1)
+    assert e.colors_set == before + 1
+    assert tuple(e.color) == (1,0,0,1)
+
+
+def test_setting_enabled_to_the_same_value_does_nothing(app):
+    class Counting(Entity):
+        enables = 0
+        def on_enable(self):
+            self.enables += 1
+
+    e = Counting()
+    e.enables = 0
+    e.enabled = False
+    e.enabled = True
+    e.enabled = True
+    assert e.enables == 1
+    assert not e.is_stashed()
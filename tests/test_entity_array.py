@@ -0,0 +1,25 @@
+from ursina import Entity, EntityArray
+
+
+def test_promoted_entities_get_their_own_model(app):
+    array = EntityArray(model='cube', count=4)
+    a = array.promote(0)
+    b = array.promote(1)
+
+    assert a.model is not b.model
+    assert a.model is not array.base_model
+    for e in (a, b):
+        assert e.model.getParent() == e
+        assert e.model.find('**/+GeomNode').node().getNumGeoms() > 0
+    assert array.hidden[0] and array.hidden[1]
+
+
+def test_demote_puts_element_back(app):
+    array = EntityArray(model='cube', count=2)
+    e = array.promote(1)
+    e.position = (1, 2, 3)
+    array.demote(e)
+
+    assert not array.hidden[1]
+    assert 1 not in array.promoted
+    assert array.positions[1].tolist() == [1, 2, 3]
@@ -0,0 +1,29 @@
+from ursina import Entity, EntityPool, destroy, scene
+
+
+def test_destroyed_entities_leave_the_pool(app):
+    pool = EntityPool(Entity, size=2)
+    a, b = pool.get(), pool.get()
+    destroy(a)
+    assert len(pool) == 1
+    assert list(pool.in_use) == [b]
+
+    pool.release(a)     # already destroyed, so this does nothing
+    assert not pool.free
+
+    c = pool.get()
+    assert not c.is_empty()
+    pool.clear()
+
+
+def test_scene_clear_empties_the_pool(app):
+    pool = EntityPool(Entity, size=3)
+    in_use = pool.get()
+    scene.clear()
+    assert len(pool) == 0
+
+    pool.release(in_use)
+    e = pool.get()
+    assert not e.is_empty() and e.enabled
+    assert list(pool.in_use) == [e]
+    pool.clear()
@@ -0,0 +1,46 @@
+from ursina import Entity, application, destroy, time
+
+
+class Ball(Entity):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.velocity = 5
+        self.history = list()
+
+    def fixed_update(self):
+        self.velocity -= 9.8 * time.dt
+        self.y += self.velocity * time.dt
+        self.rotation_y += 90 * time.dt
+        self.history.append((self.y, self.rotation_y))
+
+
+def simulate(app, fps, seconds=1, update=None):
+    ball = Ball()
+    if update:
+        ball.update = update.__get__(ball)
+    app.step(int(seconds * fps), dt=1/fps)
+    destroy(ball)
+    return ball.history
+
+
+def test_fixed_update_gives_the_same_result_at_any_frame_rate(app, monkeypatch):
+    monkeypatch.setattr(application, 'fixed_timestep', 1/60)
+    app.step(1, dt=1/60)    # start from a whole number of steps
+
+    results = {fps : simulate(app, fps) for fps in (20, 30, 60, 144)}
+    assert len(results[60]) == 60
+    for fps, history in results.items():
+        assert history == results[60], fps
+
+
+def test_changes_made_in_update_are_kept_per_component(app, monkeypatch):
+    # update() turns the ball, so its rotation should stay as set, but the simulated position should still be restored
+    monkeypatch.setattr(application, 'fixed_timestep', 1/60)
+    app.step(1, dt=1/60)
+
+    def update(self):
+        self.rotation_x += 1
+
+    reference = simulate(app, 144)
+    turning = simulate(app, 144, update=update)
+    assert [y for y, rotation_y in turning] == [y for y, rotation_y in reference]
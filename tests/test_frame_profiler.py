@@ -0,0 +1,38 @@
+from functools import partial
+
+
+class Callable():
+    def __call__(self):
+        pass
+
+
+def test_labels_for_callables_without_a_name(app):
+    from ursina.sequence import Sequence, Func
+    from ursina import application, destroy
+    from ursina.prefabs.frame_profiler import FrameProfiler
+    profiler = FrameProfiler(enabled=False)
+    try:
+        assert application.profiler is None
+        profiler.call('update', Sequence(Func(partial(print, end=''))), lambda: None)
+        profiler.call('update', Sequence(Func(Callable())), lambda: None)
+        profiler.call('update', Sequence(Func(len, '')), lambda: None)
+        labels = [label for category, label in profiler._frame_totals]
+        assert labels == ['Sequence(partial)', 'Sequence(Callable)', 'Sequence(len)']
+    finally:
+        application.profiler = None
+        destroy(profiler)
+
+
+def test_profiler_only_runs_while_enabled(app):
+    from ursina import application, destroy
+    from ursina.prefabs.frame_profiler import FrameProfiler
+    profiler = FrameProfiler()
+    try:
+        assert application.profiler is profiler
+        app.step(2, dt=1/60)
+        assert ('frame', 'total') in profiler.history
+        profiler.enabled = False
+        assert application.profiler is None
+    finally:
+        application.profiler = None
+        destroy(profiler)
@@ -0,0 +1,54 @@
+import numpy
+import pytest
+from ursina import Mesh
+
+
+def test_update_vertices_on_a_non_contiguous_array(app):
+    vertices = numpy.zeros(36, dtype=numpy.float32)[::2]    # every other value, so reshape() would copy it
+    m = Mesh(vertices=vertices)
+    m.update_vertices(3, [(1,2,3), (4,5,6)])
+    assert m.vertices[3].tolist() == [1,2,3]
+    assert m.vertices[4].tolist() == [4,5,6]
+    assert Mesh(vertices=m.vertices, static=False).recipe == m.recipe
+
+
+def test_update_vertices_past_the_end_grows_the_mesh(app):
+    m = Mesh(vertices=numpy.zeros((3, 3), dtype=numpy.float32))
+    m.update_vertices(3, numpy.ones((3, 3)))
+    assert len(m.vertices) == 6 and m.vdata.getNumRows() == 6
+    assert m.vertices[5].tolist() == [1,1,1]
+
+    m = Mesh(vertices=[(0,0,0), (1,0,0), (0,1,0)])
+    m.update_vertices(2, [(0,2,0), (2,2,0), (0,3,0), (3,3,0)])
+    assert len(m.vertices) == 6 and m.vdata.getNumRows() == 6
+
+
+def test_update_vertices_with_a_gap_raises(app):
+    for vertices in (numpy.zeros((3, 3), dtype=numpy.float32), [(0,0,0), (1,0,0), (0,1,0)]):
+        m = Mesh(vertices=vertices)
+        with pytest.raises(IndexError):
+            m.update_vertices(4, [(1,1,1)])
+        with pytest.raises(IndexError):
+            m.update_vertices(-1, [(1,1,1)])
+        assert len(m.vertices) == 3
+
+
+def test_meshes_made_from_arrays(app):
+    from ursina import EntityArray
+    vertices = numpy.array(((0,0,0), (1,0,0), (1,1,0), (0,1,0)), dtype=numpy.float32)
+    m = Mesh(vertices=vertices, triangles=numpy.array(((0,1,2), (2,3,0))))
+    normals = m.generate_normals()
+    assert len(normals) == 4
+
+    a = EntityArray(model=Mesh(vertices=vertices, triangles=numpy.array((0,1,2,2,3,0)), uvs=numpy.zeros((4,2))), count=2)
+    assert a.model.node().getGeom(0).getPrimitive(0).getNumVertices() == 12
+
+
+def test_polygons_in_a_triangles_array_become_fans(app):
+    pentagon = [(0,0,0), (1,0,0), (1.5,1,0), (.5,1.5,0), (-.5,1,0)]
+    m = Mesh(vertices=numpy.array(pentagon, dtype=numpy.float32), triangles=numpy.array(((0,1,2,3,4), )))
+    assert list(m._flat_triangle_array()) == [0,1,2, 0,2,3, 0,3,4]
+    assert m.geomNode.getGeom(0).getPrimitive(0).getNumVertices() == 9
+
+    with pytest.raises(ValueError):
+        Mesh(vertices=numpy.array(pentagon, dtype=numpy.float32), triangles=numpy.array(((0,1), (2,3))))
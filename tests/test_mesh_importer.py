@@ -0,0 +1,18 @@
+from ursina import Mesh
+from ursina.mesh_importer import load_model
+
+
+def test_load_model_prefers_npz_and_ignores_other_dotted_names(app, tmp_path):
+    triangle = Mesh(vertices=((0,0,0), (1,0,0), (0,1,0)))
+    triangle.save('triangle', tmp_path, filetype='ursinamesh')
+    (tmp_path / 'sub').mkdir()
+    Mesh(vertices=((0,0,0), (2,0,0), (0,2,0))).save('triangle', tmp_path / 'sub', filetype='npz')
+    Mesh(vertices=((0,0,0), (3,0,0), (0,3,0))).save('triangle.old', tmp_path, filetype='npz')
+
+    m = load_model('triangle', tmp_path)
+    assert m.path.name == 'triangle.npz'
+    assert tuple(m.vertices[1]) == (2,0,0)
+
+    (tmp_path / 'sub' / 'triangle.npz').unlink()
+    assert load_model('triangle', tmp_path).path.suffix == '.ursinamesh'
+    assert load_model('missing', tmp_path) is None
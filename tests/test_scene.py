@@ -0,0 +1,12 @@
+from ursina import Entity, destroy, scene
+
+
+def test_find_by_keyword_or_by_panda_path(app):
+    e = Entity(name='find_me', model='cube')
+    try:
+        assert scene.find(name='find_me') is e
+        found = scene.find('**/+GeomNode')
+        assert not found.is_empty() and found.node().getNumGeoms()
+        assert scene.find('**/no_such_node').is_empty()
+    finally:
+        destroy(e)
@@ -0,0 +1,17 @@
+from ursina import application, invoke
+
+
+def test_timers_wait_while_paused_unless_they_ignore_it(app):
+    called = list()
+    application.pause()
+    try:
+        paused_timer = invoke(called.append, 'paused', delay=.01)
+        invoke(called.append, 'ignore_paused', delay=.01, ignore_paused=True)
+        app.step(5, dt=1/60)
+        assert called == ['ignore_paused']
+        assert paused_timer.time_left > 0
+    finally:
+        application.resume()
+
+    app.step(5, dt=1/60)
+    assert called == ['ignore_paused', 'paused']
@@ -9,10 +9,14 @@ from ursina.texture_importer import *
 from ursina import color
 from ursina.color import Color
 from ursina.sequence import Sequence, Func, Wait
+from ursina.coroutines import start_coroutine, wait, next_frame, until
 from ursina.entity import Entity
 from ursina.collider import *
 from ursina.audio import Audio
 from ursina.duplicate import duplicate
+from ursina.entity_pool import EntityPool
+from ursina.entity_array import EntityArray
+from ursina.instancer import Instancer, InstancedEntity
 from ursina import input_handler
 from ursina.vec3 import Vec3
 
@@ -56,5 +60,6 @@ from ursina.prefabs.file_browser import FileBrowser
 from ursina.prefabs import primitives
 
 from ursina.prefabs.debug_menu import DebugMenu
+from ursina.prefabs.frame_profiler import FrameProfiler
 from ursina.prefabs.editor_camera import EditorCamera
 from ursina.prefabs.hot_reloader import HotReloader
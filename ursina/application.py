@@ -1,13 +1,20 @@
 import sys
 from pathlib import Path
 from panda3d.core import getModelPath
+from ursina.jobs import Jobs
 
 
 paused = False
+headless = False    # set by Ursina(headless=True). renders to an offscreen buffer instead of opening a window.
 time_scale = 1
+fixed_timestep = None   # set to for example 1/60 to call fixed_update() at a fixed rate, independent of the frame rate.
+max_fixed_steps = 5     # max number of fixed_update() calls per frame, so a long frame won't make the simulation fall further and further behind.
+interpolate_fixed_timestep = True   # smooth out the transforms of entities with fixed_update() between fixed steps when rendering.
 sequences = list()
 trace_entity_definition = True # enable to set entity.line_definition
 print_entity_definition = False
+jobs = Jobs()   # run slow functions in the background with application.jobs.submit(function, *args, on_done=callback)
+profiler = None     # gets set by FrameProfiler. records how long update(), input() and so on take.
 
 
 def pause():
@@ -62,7 +62,7 @@ class MeshCollider(Collider):
         self.node_path = entity.attachNewNode(CollisionNode('CollisionNode'))
         node = self.node_path.node()
 
-        if mesh.triangles:
+        if len(mesh.triangles):
             for tri in mesh.triangles:
                 if len(tri) == 3:
                     shape = CollisionPolygon(
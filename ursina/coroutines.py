@@ -0,0 +1,122 @@
+import asyncio
+import heapq
+import itertools
+from ursina import application
+
+
+# coroutines run on an asyncio event loop that gets stepped once per frame by Ursina._update,
+# so they can use asyncio for sockets, files and subprocesses without blocking rendering.
+# wait(), next_frame() and until() follow the game clock instead, so they respect pause and time_scale.
+loop = None
+elapsed = 0     # game time in seconds. doesn't advance while paused.
+
+_next_frame = list()
+_timers = list()    # heap of (time, i, future)
+_predicates = list()    # (predicate, future)
+_tasks = set()  # running coroutines, so scene.clear() can cancel them
+_counter = itertools.count()
+
+
+def _get_loop():
+    global loop
+    if loop is None:
+        loop = asyncio.new_event_loop()
+    return loop
+
+
+def start_coroutine(coroutine):     # returns an asyncio.Task, which can be cancelled with .cancel()
+    task = _get_loop().create_task(coroutine)
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+    return task
+
+
+def next_frame():
+    future = _get_loop().create_future()
+    _next_frame.append(future)
+    return future
+
+
+def wait(seconds):
+    future = _get_loop().create_future()
+    heapq.heappush(_timers, (elapsed + seconds, next(_counter), future))
+    return future
+
+
+def until(predicate):   # checked once per frame
+    future = _get_loop().create_future()
+    _predicates.append((predicate, future))
+    return future
+
+
+def _resolve(future):
+    if not future.done():   # might have been cancelled
+        future.set_result(None)
+
+
+def update(dt):     # called by Ursina._update
+    global elapsed, _next_frame, _predicates
+    if loop is None:
+        return
+
+    if not application.paused:
+        elapsed += dt
+
+    frame_futures, _next_frame = _next_frame, list()
+    for future in frame_futures:
+        _resolve(future)
+
+    while _timers and _timers[0][0] <= elapsed:
+        _resolve(heapq.heappop(_timers)[2])
+
+    if _predicates:
+        waiting = list()
+        for predicate, future in _predicates:
+            if future.done():
+                continue
+            if predicate():
+                _resolve(future)
+            else:
+                waiting.append((predicate, future))
+        _predicates = waiting
+
+    # run everything that's ready, without waiting for anything
+    loop.call_soon(loop.stop)
+    loop.run_forever()
+
+
+def clear():    # cancel all the coroutines and what they're waiting for. they get the CancelledError on the next update().
+    for task in _tasks:
+        task.cancel()
+    _tasks.clear()
+
+    for future in _next_frame + [e[2] for e in _timers] + [e[1] for e in _predicates]:
+        future.cancel()
+    _next_frame.clear()
+    _timers.clear()
+    _predicates.clear()
+
+
+
+if __name__ == '__main__':
+    from ursina import *
+    app = Ursina()
+    e = Entity(model='cube', color=color.orange)
+
+    async def blink():
+        while True:
+            e.color = color.orange
+            await wait(.5)
+            e.color = color.azure
+            await wait(.5)
+
+    async def move_when_pressed():
+        await until(lambda: held_keys['space'])
+        print('space pressed')
+        for i in range(60):
+            e.x += .05
+            await next_frame()
+
+    start_coroutine(blink())
+    start_coroutine(move_when_pressed())
+    app.run()
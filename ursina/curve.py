@@ -64,7 +64,7 @@ def in_out_quart(t):
     if t < .5:
         return 8 * t * t * t * t
     else:
-        1 - 8 * t1 * t1 * t1 * t1
+        return 1 - 8 * t1 * t1 * t1 * t1
 
 
 def in_quint(t):
@@ -244,7 +244,8 @@ for e in dir(sys.modules[__name__]):
 
 # bezier code is translated  from WebKit implementation
 class CubicBezier:
-    __slots__ = ['a', 'b', 'c', 'd', 'cx', 'bx', 'ax', 'cy', 'by', 'ay']
+    __slots__ = ['a', 'b', 'c', 'd', 'cx', 'bx', 'ax', 'cy', 'by', 'ay', '_table', '_array_table']
+    table_size = 1024   # calculate() looks up y in a table of this many evenly spaced x values and lerps between them
 
     def __init__(self, a, b, c, d):
         self.a = a
@@ -260,6 +261,8 @@ class CubicBezier:
         self.cy = 3.0 * b
         self.by = 3.0 * (d - b) - self.cy
         self.ay = 1.0 - self.cy - self.by
+        self._table = None
+        self._array_table = None
 
     def sample_curve_x(self, t):
         return ((self.ax * t + self.bx) * t + self.cx) * t
@@ -270,8 +273,46 @@ class CubicBezier:
     def sample_curve_derivative_x(self, t):
         return (3.0 * self.ax * t + 2.0 * self.bx) * t + self.cx
 
+    def _build_table(self):
+        # sample the curve densely, then find y for each evenly spaced x, so calculate() doesn't have to solve for x every time
+        n = CubicBezier.table_size
+        samples = n * 4
+        xs = [self.sample_curve_x(i / samples) for i in range(samples + 1)]
+        ys = [self.sample_curve_y(i / samples) for i in range(samples + 1)]
+
+        self._table = list()
+        j = 0
+        for i in range(n + 1):
+            x = i / n
+            while j < samples - 1 and xs[j+1] < x:
+                j += 1
+            x0, x1 = xs[j], xs[j+1]
+            f = min(max((x - x0) / (x1 - x0), 0), 1) if x1 != x0 else 0
+            self._table.append(ys[j] + (ys[j+1] - ys[j]) * f)
+
     def calculate(self, x, epsilon=.0001):
-        return self.sample_curve_y(self.solve_curve_x(x, epsilon))
+        if self._table is None:
+            self._build_table()
+
+        if x <= 0:
+            return self._table[0]
+        if x >= 1:
+            return self._table[-1]
+
+        i = x * CubicBezier.table_size
+        j = int(i)
+        return self._table[j] + (self._table[j+1] - self._table[j]) * (i - j)
+
+    __call__ = calculate    # so it can be used like the other curves, like entity.animate_x(1, curve=CubicBezier(0,.7,1,.3))
+
+    def calculate_array(self, x):   # calculate() for a numpy array of x values at once
+        import numpy
+        if self._array_table is None:
+            if self._table is None:
+                self._build_table()
+            self._array_table = numpy.array(self._table)
+
+        return numpy.interp(x, numpy.linspace(0, 1, len(self._array_table)), self._array_table)
 
     def solve_curve_x(self, t, epsilon=.0001):
         # First try a few iterations of Newton's method -- normally very fast.
@@ -318,6 +359,172 @@ class CubicBezier:
         return t2
 
 
+# numpy versions of the curves, for when lots of values need the same curve each frame, like thousands of particles fading out.
+# use evaluate(curve.in_expo, t) where t is a numpy array of values between 0 and 1. it returns an array of the same shape.
+# works with every curve in this file, including the _boomerang ones and CubicBezier. other functions get called once per value.
+_array_functions = None
+
+def evaluate(function, t, **kwargs):
+    import numpy
+    t = numpy.asarray(t)
+    if t.dtype.kind != 'f':
+        t = t.astype(float)
+
+    if isinstance(function, CubicBezier):
+        return function.calculate_array(t)
+
+    global _array_functions
+    if _array_functions is None:
+        _array_functions = _make_array_functions()
+
+    name = getattr(function, '__name__', None)
+    if name not in _array_functions or globals().get(name) is not function:
+        return numpy.array([function(e, **kwargs) for e in t.ravel()], dtype=t.dtype).reshape(t.shape)
+
+    with numpy.errstate(all='ignore'):  # both sides of the in_out curves get calculated, so ignore the side that's out of range
+        return _array_functions[name](t, **kwargs)
+
+
+def _make_array_functions():
+    import numpy as np
+
+    def linear(t):
+        return t
+
+    def in_sine(t):
+        return -1 * np.cos(t * (pi / 2)) + 1
+
+    def out_sine(t):
+        return np.sin(t * (pi / 2))
+
+    def in_out_sine(t):
+        return -.5 * (np.cos(pi * t) - 1)
+
+    def in_quad(t):
+        return t * t
+
+    def out_quad(t):
+        return t * (2 - t)
+
+    def in_out_quad(t):
+        return np.where(t < .5, 2 * t * t, -1 + (4 - 2 * t) * t)
+
+    def in_cubic(t):
+        return t * t * t
+
+    def out_cubic(t):
+        t1 = t - 1
+        return t1 * t1 * t1 + 1
+
+    def in_out_cubic(t):
+        return np.where(t < .5, 4 * t * t * t, (t - 1) * (2 * t - 2) * (2 * t - 2) + 1)
+
+    def in_quart(t):
+        return t * t * t * t
+
+    def out_quart(t):
+        t1 = t - 1
+        return 1 - t1 * t1 * t1 * t1
+
+    def in_out_quart(t):
+        t1 = t - 1
+        return np.where(t < .5, 8 * t * t * t * t, 1 - 8 * t1 * t1 * t1 * t1)
+
+    def in_quint(t):
+        return t * t * t * t * t
+
+    def out_quint(t):
+        t1 = t - 1
+        return 1 + t1 * t1 * t1 * t1 * t1
+
+    def in_out_quint(t):
+        t1 = t - 1
+        return np.where(t < .5, 16 * t * t * t * t * t, 1 + 16 * t1 * t1 * t1 * t1 * t1)
+
+    def in_expo(t):
+        return np.power(2, 10 * (t - 1))
+
+    def out_expo(t):
+        return -np.power(2, -10 * t) + 1
+
+    def in_out_expo(t):
+        scaled_time1 = t * 2 - 1
+        return np.where(t < .5, .5 * np.power(2, 10 * scaled_time1), .5 * (-np.power(2, -10 * scaled_time1) + 2))
+
+    def in_circ(t):
+        return -1 * (np.sqrt(1 - t * t) - 1)
+
+    def out_circ(t):
+        t1 = t - 1
+        return np.sqrt(1 - t1 * t1)
+
+    def in_out_circ(t):
+        scaled_time = t * 2
+        scaled_time1 = scaled_time - 2
+        return np.where(scaled_time < 1, -.5 * (np.sqrt(1 - scaled_time * scaled_time) - 1), .5 * (np.sqrt(1 - scaled_time1 * scaled_time1) + 1))
+
+    def in_back(t, magnitude=1.70158):
+        return t * t * ((magnitude + 1) * t - magnitude)
+
+    def out_back(t, magnitude=1.70158):
+        scaled_time = t - 1
+        return (scaled_time * scaled_time * ((magnitude + 1) * scaled_time + magnitude)) + 1
+
+    def in_out_back(t, magnitude=1.70158):
+        scaled_time = t * 2
+        scaled_time2 = scaled_time - 2
+        s = magnitude * 1.525
+        return np.where(scaled_time < 1,
+            .5 * scaled_time * scaled_time * (((s + 1) * scaled_time) - s),
+            .5 * (scaled_time2 * scaled_time2 * ((s + 1) * scaled_time2 + s) + 2)
+            )
+
+    def in_elastic(t, magnitude=.7):
+        scaled_time1 = t - 1
+        p = 1 - magnitude
+        s = p / (2 * pi) * asin(1)
+        value = -(np.power(2, 10 * scaled_time1) * np.sin((scaled_time1 - s) * (2 * pi) / p))
+        return np.where((t == 0) | (t == 1), t, value)
+
+    def out_elastic(t, magnitude=.7):
+        p = 1 - magnitude
+        scaled_time = t * 2
+        s = p / (2 * pi) * asin(1)
+        value = (np.power(2, -10 * scaled_time) * np.sin((scaled_time - s) * (2 * pi) / p)) + 1
+        return np.where((t == 0) | (t == 1), t, value)
+
+    def in_out_elastic(t, magnitude=0.65):
+        p = 1 - magnitude
+        scaled_time = t * 2
+        scaled_time1 = scaled_time - 1
+        s = p / (2 * pi) * asin(1)
+        wave = np.power(2, np.where(scaled_time < 1, 10, -10) * scaled_time1) * np.sin((scaled_time1 - s) * (2 * pi) / p)
+        value = np.where(scaled_time < 1, -.5 * wave, wave * .5 + 1)
+        return np.where((t == 0) | (t == 1), t, value)
+
+    def out_bounce(t):
+        t2 = np.select((t < 1 / 2.75, t < 2 / 2.75, t < 2.5 / 2.75), (t, t - (1.5 / 2.75), t - (2.25 / 2.75)), t - (2.625 / 2.75))
+        offset = np.select((t < 1 / 2.75, t < 2 / 2.75, t < 2.5 / 2.75), (0, .75, .9375), .984375)
+        return 7.5625 * t2 * t2 + offset
+
+    def in_bounce(t):
+        return 1 - out_bounce(1 - t)
+
+    def in_out_bounce(t):
+        return np.where(t < .5, in_bounce(t * 2) * .5, (out_bounce((t * 2) - 1) * .5) + .5)
+
+    functions = {name : f for name, f in locals().items() if name != 'np'}
+
+    def make_boomerang(f):
+        def boomerang(t, **kwargs):
+            return f(np.where(t < .5, t * 2, 1 - ((t - .5) * 2)), **kwargs)
+        return boomerang
+
+    for name, f in tuple(functions.items()):
+        functions[f'{name}_boomerang'] = make_boomerang(f)
+
+    return functions
+
 if __name__ == '__main__':
     '''Draws a sheet with every curve and it's name'''
     from ursina import *
@@ -346,6 +553,8 @@ if __name__ == '__main__':
 
     c = CubicBezier(0, .5, 1, .5)
     print('-----------', c.calculate(.23))
+    import numpy
+    print('-----------', evaluate(in_out_elastic, numpy.linspace(0, 1, 5)), evaluate(c, numpy.linspace(0, 1, 5)))
     # for x, c in enumerate([curve.CubicBezier(0,1,1,0), curve.CubicBezier(0,.5,1,.5), curve.CubicBezier(0,0,0,0), curve.CubicBezier(0,.7,1,.3)]):
     #     verts = [Vec3(i/20, c.calculate(i/20), 0) for i in range(20)]
     #     Entity(parent=camera.ui, model=Mesh(vertices=verts, mode='line', thickness=3), scale=.25, x=-.5+(x*.25))
@@ -50,7 +50,7 @@ class ColorMenu(Entity):
 
     def open(self):
         self.menu.position = self.scene_editor.selection.screen_position
-        invoke(setattr, self.menu, 'enabled', True, delay=.05)
+        invoke(setattr, self.menu, 'enabled', True, delay=.05, ignore_paused=True)
 
 
 
@@ -1,5 +1,6 @@
 import sys
 import inspect
+import linecache
 import importlib
 import glob
 from pathlib import Path
@@ -18,6 +19,7 @@ from ursina import application
 from ursina.collider import *
 from ursina.mesh import Mesh
 from ursina.sequence import Sequence, Func, Wait
+from ursina.tween import Tween
 from ursina.ursinamath import lerp
 from ursina import curve
 from ursina.curve import CubicBezier
@@ -38,14 +40,20 @@ class Entity(NodePath):
 
     def __init__(self, add_to_scene_entities=True, **kwargs):
         super().__init__(self.__class__.__name__)
+        self._children = dict()     # child entities in the order they got parented. read with .children
+        self._definition = None     # (filename, lineno, function) of the line that made the entity. see line_definition
+        self._line_definition = None
+        self._name_from_definition = False
+        self._tags = set()      # see add_tag()
 
         self.name = camel_to_snake(self.type)
         self.enabled = True     # disabled entities wil not be visible nor run code
         self.visible = True
         self.ignore = False     # if True, will not try to run code
+        # set update_rate to for example 10 to only call update() 10 times per second instead of every frame. time.dt will be the time since the last update.
         self.eternal = False    # eternal entities does not get destroyed on scene.clear()
         self.ignore_paused = False
-        self.ignore_input = False
+        self.ignore_input = False   # give the class an input_keys attribute, like input_keys = ('space', 'space up'), to only get input() for those keys.
 
         self.parent = scene
         self.add_to_scene_entities = add_to_scene_entities
@@ -63,6 +71,7 @@ class Entity(NodePath):
 
         self.collision = False  # toggle collision without changing collider.
         self.collider = None    # set to 'box'/'sphere'/'mesh' for auto fitted collider.
+        self._subscribed_keys = set()
         self.scripts = list()   # add with add_script(class_instance). will assign an 'entity' variable to the script.
         self.animations = list()
         self.hovered = False    # will return True if mouse hovers entity.
@@ -72,32 +81,140 @@ class Entity(NodePath):
         self.rotation = Vec3(0,0,0) # can also set self.rotation_x, self.rotation_y, self.rotation_z
         self.scale = Vec3(1,1,1)    # can also set self.scale_x, self.scale_y, self.scale_z
 
-        self.line_definition = None # returns a Traceback(filename, lineno, function, code_context, index).
         if application.trace_entity_definition and add_to_scene_entities:
-            from inspect import getframeinfo, stack
-            _stack = stack()
-            caller = getframeinfo(_stack[1][0])
-            if len(_stack) > 2 and _stack[1].code_context and 'super().__init__()' in _stack[1].code_context[0]:
-                caller = getframeinfo(_stack[2][0])
+            # only remember where the entity was made. the source line gets read when line_definition or name is asked for.
+            frame = sys._getframe(1)
+            while frame.f_back and frame.f_code.co_name == '__init__' and frame.f_locals.get('self') is self:   # skip super().__init__()
+                frame = frame.f_back
 
-            self.line_definition = caller
-            if caller.code_context:
-                self.code_context = caller.code_context[0]
+            self._definition = (frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name)
+            self._name_from_definition = True
+            scene.entities._name_later(self)
 
-                if (self.code_context.count('(') == self.code_context.count(')') and
-                ' = ' in self.code_context and not 'name=' in self.code_context
-                and not 'Ursina()' in self.code_context):
-
-                    self.name = self.code_context.split(' = ')[0].strip().replace('self.', '')
-                    # print('set name to:', self.code_context.split(' = ')[0].strip().replace('self.', ''))
-
-                if application.print_entity_definition:
-                    print(f'{Path(caller.filename).name} ->  {caller.lineno} -> {caller.code_context}')
+            if application.print_entity_definition:
+                caller = self.line_definition
+                print(f'{Path(caller.filename).name} ->  {caller.lineno} -> {caller.code_context}')
 
 
         for key, value in kwargs.items():
             setattr(self, key, value)
 
+        self._refresh_update_registry()
+        self._refresh_input_registry()
+
+
+    @property
+    def line_definition(self):  # returns a Traceback(filename, lineno, function, code_context, index).
+        if self._line_definition is None and self._definition:
+            filename, lineno, function = self._definition
+            code = linecache.getline(filename, lineno)
+            self._line_definition = inspect.Traceback(filename, lineno, function, [code] if code else None, 0)
+            if code:
+                self.code_context = code
+
+        return self._line_definition
+
+    @line_definition.setter
+    def line_definition(self, value):
+        self._line_definition = value
+
+
+    @property
+    def name(self):
+        if self._name_from_definition:
+            # name the entity after the variable it was assigned to, like player = Entity() -> 'player'
+            self._name_from_definition = False
+            code = self.line_definition.code_context[0] if self.line_definition.code_context else ''
+            if (code.count('(') == code.count(')') and ' = ' in code
+            and not 'name=' in code and not 'Ursina()' in code):
+                self.name = code.split(' = ')[0].strip().replace('self.', '')
+
+        return self.getName()
+
+    @name.setter
+    def name(self, value):
+        self._name_from_definition = False
+        old_name = self.getName()
+        self.setName(value)
+        scene.entities._rename(self, old_name)
+
+
+    def add_tag(self, *tags):   # find them with scene.find_all(tag='enemy')
+        for tag in tags:
+            self._tags.add(tag)
+            scene.entities._add_tag(self, tag)
+
+    def remove_tag(self, *tags):
+        for tag in tags:
+            self._tags.discard(tag)
+            scene.entities._remove_tag(self, tag)
+
+    @property
+    def entity_tags(self):
+        return frozenset(self._tags)
+
+
+    def _refresh_update_registry(self):
+        # keep track of the entities that actually have something to update, so Ursina._update won't have to check every entity every frame.
+        if not self.add_to_scene_entities:
+            return
+
+        # entities with an update_rate get updated that many times per second instead of every frame.
+        update_rate = getattr(self, 'update_rate', None)
+        if update_rate:
+            update_registry = scene.update_rate_registry.setdefault(update_rate, dict())
+        else:
+            update_registry = scene.update_registry
+
+        for registry in [scene.update_registry, ] + list(scene.update_rate_registry.values()):
+            if registry is not update_registry:
+                registry.pop(self, None)
+
+        for function_name, registry in (('update', update_registry), ('fixed_update', scene.fixed_update_registry)):
+            scripts = [s for s in self.scripts if hasattr(s, function_name)]
+            has_function = hasattr(self, function_name)
+
+            if self.enabled and (has_function or scripts):
+                registry[self] = (has_function, scripts)
+            else:
+                registry.pop(self, None)
+
+
+    def _refresh_input_registry(self):
+        # entities and scripts with input_keys only get the keys they listen for, the rest get every key.
+        if not self.add_to_scene_entities:
+            return
+
+        self._remove_from_input_registry()
+        if not self.enabled:
+            return
+
+        for handler in [self, ] + self.scripts:
+            if not hasattr(handler, 'input'):
+                continue
+
+            keys = getattr(handler, 'input_keys', None)
+            if keys is None:
+                scene.input_registry.setdefault(self, list()).append(handler)
+                continue
+
+            if isinstance(keys, str):
+                keys = (keys, )
+            for key in keys:
+                scene.input_key_registry.setdefault(key, dict()).setdefault(self, list()).append(handler)
+                self._subscribed_keys.add(key)
+
+
+    def _remove_from_input_registry(self):
+        for key in self._subscribed_keys:
+            subscribers = scene.input_key_registry[key]
+            subscribers.pop(self, None)
+            if not subscribers:
+                del scene.input_key_registry[key]
+
+        self._subscribed_keys = set()
+        scene.input_registry.pop(self, None)
+
 
     def _list_to_vec(self, value):
         if isinstance(value, (int, float, complex)):
@@ -120,117 +237,194 @@ class Entity(NodePath):
 
 
     def __setattr__(self, name, value):
+        # most attributes are plain values or properties. the ones that need extra work have a setter in _setters.
+        setter = self._setters.get(name)
+        if setter:
+            setter(self, name, value)
+            return
+
+        try:
+            object.__setattr__(self, name, value)
+        except:
+            pass
+            # print('failed to set attribiute:', name)
+
+
+    def _set_value(self, name, value):
+        try:
+            object.__setattr__(self, name, value)
+        except:
+            pass
 
-        if name == 'enabled':
-            try:
-                # try calling on_enable() on classes inheriting from Entity
-                if value == True:
-                    self.on_enable()
-                else:
-                    self.on_disable()
-            except:
-                pass
 
+    def _set_enabled(self, name, value):
+        if value == self.__dict__.get('enabled'):   # nothing to stash or refresh
+            return
+
+        try:
+            # try calling on_enable() on classes inheriting from Entity
             if value == True:
-                if not self.is_singleton():
-                    self.unstash()
+                self.on_enable()
             else:
-                if not self.is_singleton():
-                    self.stash()
+                self.on_disable()
+        except:
+            pass
 
-        if name == 'eternal':
-            for c in self.children:
-                c.eternal = value
+        if value == True:
+            if not self.is_singleton():
+                self.unstash()
+        else:
+            if not self.is_singleton():
+                self.stash()
 
-        if name == 'world_parent':
-            self.reparent_to(value)
+        self._set_value(name, value)
+        if hasattr(self, 'scripts'):
+            self._refresh_update_registry()
+            self._refresh_input_registry()
 
-        if name == 'model':
-            if value is None:
-                if hasattr(self, 'model') and self.model:
-                    self.model.removeNode()
-                    # print('removed model')
-                object.__setattr__(self, name, value)
-                return None
 
-            if isinstance(value, NodePath): # pass procedural model
-                if self.model is not None and value != self.model:
-                    self.model.removeNode()
-                object.__setattr__(self, name, value)
-
-            elif isinstance(value, str): # pass model asset name
-                m = load_model(value, application.asset_folder)
-                if not m:
-                    m = load_model(value, application.internal_models_folder)
-                if m:
-                    if self.model is not None:
-                        self.model.removeNode()
-                    object.__setattr__(self, name, m)
-                    if isinstance(m, Mesh):
-                        m.recipe = value
-                    # print('loaded model successively')
-                else:
-                    print('missing model:', value)
-                    return
+    def _set_eternal(self, name, value):
+        for c in self.children:
+            c.eternal = value
+        self._set_value(name, value)
 
-            if self.model:
-                self.model.reparentTo(self)
-                self.model.setTransparency(TransparencyAttrib.M_dual)
-                self.color = self.color # reapply color after changing model
-                self.texture = self.texture # reapply texture after changing model
-                self._vert_cache = None
-                if isinstance(value, Mesh):
-                    if hasattr(value, 'on_assign'):
-                        value.on_assign(assigned_to=self)
+
+    def _set_world_parent(self, name, value):
+        self.reparent_to(value)
+        self._set_value(name, value)
+
+
+    def _set_model(self, name, value):
+        if value is None:
+            if hasattr(self, 'model') and self.model:
+                self.model.removeNode()
+                # print('removed model')
+            object.__setattr__(self, name, value)
+            return
+
+        if isinstance(value, NodePath): # pass procedural model
+            if self.model is not None and value != self.model:
+                self.model.removeNode()
+            object.__setattr__(self, name, value)
+
+        elif isinstance(value, str): # pass model asset name
+            m = load_model(value, application.asset_folder)
+            if not m:
+                m = load_model(value, application.internal_models_folder)
+            if m:
+                if self.model is not None:
+                    self.model.removeNode()
+                object.__setattr__(self, name, m)
+                if isinstance(m, Mesh):
+                    m.recipe = value
+                # print('loaded model successively')
+            else:
+                print('missing model:', value)
                 return
 
-        if name == 'color' and value is not None:
+        if self.model:
+            self.model.reparentTo(self)
+            self.model.setTransparency(TransparencyAttrib.M_dual)
+            self.color = self.color # reapply color after changing model
+            self.texture = self.texture # reapply texture after changing model
+            self._vert_cache = None
+            if isinstance(value, Mesh):
+                if hasattr(value, 'on_assign'):
+                    value.on_assign(assigned_to=self)
+            return
+
+        self._set_value(name, value)
+
+
+    def _set_color(self, name, value):
+        if value is not None:
             if not isinstance(value, Vec4):
                 value = Vec4(value[0], value[1], value[2], value[3])
 
-
             if self.model:
                 self.model.setColorScaleOff() # prevent inheriting color from parent
                 self.model.setColorScale(value)
-                object.__setattr__(self, name, value)
 
+        self._set_value(name, value)
+
+
+    def _set_texture_scale(self, name, value):
+        if self.model and self.texture:
+            self.model.setTexScale(TextureStage.getDefault(), value[0], value[1])
+        self._set_value(name, value)
 
-        if name == 'texture_scale':
-            if self.model and self.texture:
-                self.model.setTexScale(TextureStage.getDefault(), value[0], value[1])
 
-        if name == 'texture_offset':
-            if self.model and self.texture:
-                self.model.setTexOffset(TextureStage.getDefault(), value[0], value[1])
-                self.texture = self.texture
+    def _set_texture_offset(self, name, value):
+        if self.model and self.texture:
+            self.model.setTexOffset(TextureStage.getDefault(), value[0], value[1])
+            self.texture = self.texture
+        self._set_value(name, value)
 
 
-        if name == 'collision' and hasattr(self, 'collider') and self.collider:
+    def _set_collision(self, name, value):
+        if hasattr(self, 'collider') and self.collider:
             if value:
                 self.collider.node_path.unstash()
             else:
                 self.collider.node_path.stash()
 
-            object.__setattr__(self, name, value)
-            return
+        self._set_value(name, value)
 
-        if name == 'render_queue':
-            if self.model:
-                self.model.setBin('fixed', value)
 
-        if name == 'double_sided':
-            self.setTwoSided(value)
+    def _set_render_queue(self, name, value):
+        if self.model:
+            self.model.setBin('fixed', value)
+        self._set_value(name, value)
+
+
+    def _set_double_sided(self, name, value):
+        self.setTwoSided(value)
+        self._set_value(name, value)
+
 
-        if name == 'always_on_top' and value:
+    def _set_always_on_top(self, name, value):
+        if value:
             self.set_bin("fixed", 0)
             self.set_depth_write(False)
             self.set_depth_test(False)
-
-        try:
-            super().__setattr__(name, value)
-        except:
-            pass
-            # print('failed to set attribiute:', name)
+        self._set_value(name, value)
+
+
+    def _set_update_function(self, name, value):   # update, fixed_update and update_rate
+        self._set_value(name, value)
+        if hasattr(self, 'scripts'):
+            self._refresh_update_registry()
+
+
+    def _set_input_function(self, name, value):    # input and input_keys
+        self._set_value(name, value)
+        if hasattr(self, 'scripts'):
+            self._refresh_input_registry()
+
+
+    _setters = {
+        'enabled' : _set_enabled,
+        'eternal' : _set_eternal,
+        'world_parent' : _set_world_parent,
+        'model' : _set_model,
+        'color' : _set_color,
+        'texture_scale' : _set_texture_scale,
+        'texture_offset' : _set_texture_offset,
+        'collision' : _set_collision,
+        'render_queue' : _set_render_queue,
+        'double_sided' : _set_double_sided,
+        'always_on_top' : _set_always_on_top,
+        'update' : _set_update_function,
+        'fixed_update' : _set_update_function,
+        'update_rate' : _set_update_function,
+        'input' : _set_input_function,
+        'input_keys' : _set_input_function,
+        }
+
+    def __init_subclass__(cls, **kwargs):
+        # look the setters up again on each subclass, so overriding _set_model and the like works
+        super().__init_subclass__(**kwargs)
+        cls._setters = {name : getattr(cls, setter.__name__) for name, setter in cls._setters.items()}
 
 
     @property
@@ -242,6 +436,7 @@ class Entity(NodePath):
 
     @parent.setter
     def parent(self, value):
+        self._update_children_index(value)
         self._parent = value
         if value is None:
             destroy(self)
@@ -720,9 +915,19 @@ class Entity(NodePath):
         if entity is not None:
             self.wrtReparentTo(entity)
 
+        self._update_children_index(entity)
         self._parent = entity
 
 
+    def _update_children_index(self, new_parent):
+        # keep the parent's children up to date, so .children doesn't have to search through every entity.
+        old_parent = self.parent
+        if isinstance(old_parent, Entity):
+            old_parent._children.pop(self, None)
+        if isinstance(new_parent, Entity):
+            new_parent._children[self] = None
+
+
     def get_position(self, relative_to=scene):
         pos = self.getPos(relative_to)
         return Vec3(pos[0], pos[2], pos[1])
@@ -738,6 +943,8 @@ class Entity(NodePath):
             class_instance.enabled = True
             setattr(self, camel_to_snake(class_instance.__class__.__name__), class_instance)
             self.scripts.append(class_instance)
+            self._refresh_update_registry()
+            self._refresh_input_registry()
             # print('added script:', camel_to_snake(name.__class__.__name__))
             return class_instance
 
@@ -776,41 +983,26 @@ class Entity(NodePath):
 
 
     def has_ancestor(self, possible_ancestor):
-        p = self
-        if isinstance(possible_ancestor, Entity):
-            # print('ENTITY')
-            for i in range(100):
-                if p.parent:
-                    if p.parent == possible_ancestor:
-                        return True
-
-                    p = p.parent
-
-        if isinstance(possible_ancestor, list) or isinstance(possible_ancestor, tuple):
-            # print('LIST OR TUPLE')
-            for e in possible_ancestor:
-                for i in range(100):
-                    if p.parent:
-                        if p.parent == e:
-                            return True
-                            break
-                        p = p.parent
-
-        elif isinstance(possible_ancestor, str):
-            print('CLASS NAME', possible_ancestor)
-            for i in range(100):
-                if p.parent:
-                    if p.parent.__class__.__name__ == possible_ancestor:
-                        return True
-                        break
-                    p = p.parent
+        # possible_ancestor can be an entity, a list/tuple of entities or a class name
+        if isinstance(possible_ancestor, (list, tuple)):
+            return any(self.has_ancestor(e) for e in possible_ancestor)
+
+        p = self.parent
+        while p:
+            if isinstance(possible_ancestor, str):
+                if p.__class__.__name__ == possible_ancestor:
+                    return True
+            elif p == possible_ancestor:
+                return True
+
+            p = p.parent
 
         return False
 
 
     @property
     def children(self):
-        return [e for e in scene.entities if e.parent == self]
+        return [e for e in self._children if e.add_to_scene_entities]
 
 
     @property
@@ -833,6 +1025,9 @@ class Entity(NodePath):
 # ANIMATIONS
 #------------
     def animate(self, name, value, duration=.1, delay=0, curve=curve.in_expo, resolution=None, interrupt=True, time_step=None):
+        if not delay:
+            return self._animate(name, value, duration, curve, resolution, interrupt, time_step)
+
         s = Sequence(
             Wait(delay),
             Func(self._animate, name, value, duration, curve, resolution, interrupt, time_step)
@@ -842,38 +1037,23 @@ class Entity(NodePath):
 
     def _animate(self, name, value, duration=.1, curve=curve.in_expo, resolution=None, interrupt=True, time_step=None):
         animator_name = name + '_animator'
-        # print('start animating value:', name, animator_name )
-        if interrupt and hasattr(self, animator_name):
-            try:
-                getattr(self, animator_name).pause()
-                # print('interrupt', animator_name)
-            except:
-                pass
-        else:
-            try:
-                getattr(self, animator_name).finish()
-            except:
-                pass
-        setattr(self, animator_name, Sequence(time_step=time_step))
-        sequence = getattr(self, animator_name)
-        self.animations.append(sequence)
-        # sequence.append(Wait(delay))
-        if not resolution:
-            resolution = max(int(duration * 60), 1)
-
-        for i in range(resolution+1):
-            t = i / resolution
-            # if isinstance(curve, CubicBezier):
-            #     t = curve.calculate(t)
-            # else:
-            t = curve(t)
-
-            sequence.append(Wait(duration / resolution))
-            sequence.append(Func(setattr, self, name, lerp(getattr(self, name), value, t)))
-
-        sequence.start()
-        return sequence
-
+        previous = getattr(self, animator_name, None)
+        if previous:
+            if interrupt:
+                previous.pause()    # stop where it is
+            else:
+                previous.finish()   # jump to the end value
+            previous.kill()
+            if previous in self.animations:
+                self.animations.remove(previous)
+
+        tween = Tween(self, name, value, duration, curve, resolution, time_step)
+        setattr(self, animator_name, tween)
+        self.animations.append(tween)
+        tween.start()
+        return tween
+
+    # one tween per axis, like before, so animate_x() and animate_position() interrupt each other. returns (x, y, z).
     def animate_position(self, value, duration=.1, delay=0, curve=curve.in_expo, resolution=None, interrupt=True, time_step=None):
         x = self.animate('x', value[0], duration, delay, curve, resolution, interrupt, time_step)
         y = self.animate('y', value[1], duration, delay, curve, resolution, interrupt, time_step)
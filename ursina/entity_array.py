@@ -0,0 +1,211 @@
+from copy import copy
+from panda3d.core import NodePath, GeomNode, Geom, GeomTriangles, GeomPoints, GeomVertexData
+from panda3d.core import GeomVertexFormat, GeomVertexArrayFormat, InternalName
+from ursina.entity import Entity
+from ursina.mesh import Mesh, _has_data, _is_array
+from ursina.mesh_importer import load_model
+from ursina import application
+
+
+def rotation_matrices(rotations):
+    # (N,3) rotations in ursina's axes to (N,3,3) rotation matrices in panda's axes.
+    # same as NodePath.setHpr(-rotation_y, -rotation_x, rotation_z), for row vectors
+    import numpy
+    h, p, r = numpy.radians(-rotations[:, 1]), numpy.radians(-rotations[:, 0]), numpy.radians(rotations[:, 2])
+    ch, sh, cp, sp, cr, sr = numpy.cos(h), numpy.sin(h), numpy.cos(p), numpy.sin(p), numpy.cos(r), numpy.sin(r)
+    matrices = numpy.empty((len(rotations), 3, 3), dtype=numpy.float32)
+    matrices[:, 0, 0] = cr*ch - sr*sp*sh
+    matrices[:, 0, 1] = cr*sh + sr*sp*ch
+    matrices[:, 0, 2] = -sr*cp
+    matrices[:, 1, 0] = -cp*sh
+    matrices[:, 1, 1] = cp*ch
+    matrices[:, 1, 2] = sp
+    matrices[:, 2, 0] = sr*ch + cr*sp*sh
+    matrices[:, 2, 1] = sr*sh - cr*sp*ch
+    matrices[:, 2, 2] = cr*cp
+    return matrices
+
+
+# lots of copies of one model in a single Entity, for grass, bullets, markers and so on.
+# the transforms and colors are numpy arrays, so they can be updated all at once. call apply() after changing them.
+# it gets drawn as one combined geom, so it's one draw call no matter the count.
+# use promote(i) to turn one of them into a full Entity, for example to click on it, and demote(entity) to put it back.
+class EntityArray(Entity):
+
+    def __init__(self, model='quad', count=0, **kwargs):
+        import numpy
+        super().__init__()
+        if isinstance(model, str):
+            name = model
+            model = load_model(name, application.asset_folder)
+            if not model:
+                model = load_model(name, application.internal_models_folder)
+        if not isinstance(model, Mesh):
+            raise ValueError(f'EntityArray needs a Mesh or the name of one, got: {model}')
+
+        self.base_model = model
+        self.count = count
+        # in ursina's axes, like entity.position, entity.rotation, entity.scale and entity.color
+        self.positions = numpy.zeros((count, 3), dtype=numpy.float32)
+        self.rotations = numpy.zeros((count, 3), dtype=numpy.float32)
+        self.scales = numpy.ones((count, 3), dtype=numpy.float32)
+        self.colors = numpy.ones((count, 4), dtype=numpy.float32)
+        self.hidden = numpy.zeros(count, dtype=bool)
+        self.promoted = dict()  # index : Entity
+
+        self._build_geom()
+
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+        self.apply()
+
+
+    def _build_geom(self):
+        import numpy
+        m = self.base_model
+        # keep the base mesh in panda's axes (z up), which is what goes into the vertex buffer
+        self._base_vertices = numpy.array(m.vertices, dtype=numpy.float32).reshape(-1, 3)[:, (0,2,1)]
+        self._base_normals = numpy.array(m.normals, dtype=numpy.float32).reshape(-1, 3)[:, (0,2,1)] if _has_data(m.normals) else None
+        base_uvs = numpy.array(m.uvs, dtype=numpy.float32).reshape(-1, 2) if _has_data(m.uvs) else None
+        n, v = self.count, len(self._base_vertices)
+
+        array_format = GeomVertexArrayFormat()
+        array_format.add_column(InternalName.get_vertex(), 3, Geom.NT_float32, Geom.C_point)
+        vertex_format = GeomVertexFormat()
+        vertex_format.add_array(array_format)
+        for name, components, contents in (('color', 4, Geom.C_color), ('texcoord', 2, Geom.C_texcoord), ('normal', 3, Geom.C_normal)):
+            if name == 'texcoord' and base_uvs is None or name == 'normal' and self._base_normals is None:
+                continue
+            array_format = GeomVertexArrayFormat()
+            array_format.add_column(InternalName.make(name), components, Geom.NT_float32, contents)
+            vertex_format.add_array(array_format)
+
+        self._vdata = GeomVertexData('entity_array', GeomVertexFormat.register_format(vertex_format), Geom.UH_dynamic)
+        self._vdata.unclean_set_num_rows(n * v)
+        self._arrays = {name : i for i, name in enumerate(['vertex', 'color'] + (['texcoord'] if base_uvs is not None else []) + (['normal'] if self._base_normals is not None else []))}
+        if base_uvs is not None:
+            self._set_array('texcoord', numpy.tile(base_uvs, (n, 1)))
+
+        # the same triangles for every copy, offset by the number of vertices before it
+        if m.mode == 'point':
+            prim = GeomPoints(Geom.UH_static)
+            prim.add_consecutive_vertices(0, n * v)
+        else:
+            triangles = self._flat_triangles(m)
+            prim = GeomTriangles(Geom.UH_static)
+            prim.set_index_type(Geom.NT_uint32)
+            indices = (numpy.array(triangles, dtype=numpy.uint32)[None, :] + (numpy.arange(n, dtype=numpy.uint32) * v)[:, None])
+            prim.modify_vertices().unclean_set_num_rows(indices.size)
+            memoryview(prim.modify_vertices()).cast('B').cast('I')[:] = indices.ravel()
+
+        geom = Geom(self._vdata)
+        geom.add_primitive(prim)
+        node = GeomNode('entity_array')
+        node.add_geom(geom)
+        self.model = NodePath(node)
+
+
+    def _flat_triangles(self, mesh):
+        if not _has_data(mesh.triangles):
+            return list(range(len(mesh.vertices)))
+        if _is_array(mesh.triangles):
+            return mesh._flat_triangle_array().tolist()
+        if isinstance(mesh.triangles[0], int):
+            return list(mesh.triangles)
+
+        triangles = list()
+        for t in mesh.triangles:
+            if len(t) == 4:    # turn quad into tris
+                triangles.extend((t[0], t[1], t[2], t[2], t[3], t[0]))
+            else:
+                triangles.extend(t)
+        return triangles
+
+
+    def _set_array(self, name, values):
+        import numpy
+        values = numpy.ascontiguousarray(values, dtype=numpy.float32)
+        memoryview(self._vdata.modify_array(self._arrays[name])).cast('B').cast('f')[:] = values.ravel()
+
+
+    def apply(self):    # upload the positions, rotations, scales and colors. call after changing them.
+        import numpy
+        v = len(self._base_vertices)
+        scales = self.scales[:, (0,2,1)]
+        scales = numpy.where(scales == 0, .001, scales)
+        scales[self.hidden] = 0
+
+        vertices = self._base_vertices[None, :, :] * scales[:, None, :]
+        rotated = self.rotations.any()
+        if rotated:
+            matrices = self._rotation_matrices()
+            vertices = numpy.einsum('nvi,nij->nvj', vertices, matrices)
+
+        vertices += self.positions[:, None, (0,2,1)]
+        self._set_array('vertex', vertices)
+        self._set_array('color', numpy.repeat(self.colors, v, axis=0))
+
+        if self._base_normals is not None:
+            normals = numpy.broadcast_to(self._base_normals, (self.count, v, 3))
+            if rotated:
+                normals = numpy.einsum('nvi,nij->nvj', normals, matrices)
+            self._set_array('normal', normals)
+
+
+    def _rotation_matrices(self):
+        return rotation_matrices(self.rotations)
+
+
+    def promote(self, i, **kwargs):
+        # replace element i with a full Entity with the same model, transform and color. kwargs get set on the entity.
+        # each one gets a copy of the mesh, since a NodePath can only have one parent.
+        if i in self.promoted:
+            return self.promoted[i]
+
+        e = Entity(parent=self, model=copy(self.base_model), position=self.positions[i].tolist(), rotation=self.rotations[i].tolist(),
+            scale=self.scales[i].tolist(), color=self.colors[i].tolist(), texture=self.texture, **kwargs)
+        e.entity_array_index = i
+        self.promoted[i] = e
+        self.hidden[i] = True
+        self.apply()
+        return e
+
+
+    def demote(self, entity):
+        # put the promoted entity back into the array, with the transform and color it has now.
+        from ursina.ursinastuff import destroy
+        i = entity.entity_array_index
+        self.positions[i] = entity.position
+        self.rotations[i] = entity.rotation
+        self.scales[i] = entity.scale
+        self.colors[i] = tuple(entity.color)
+        self.hidden[i] = False
+        del self.promoted[i]
+        destroy(entity)
+        self.apply()
+
+
+
+if __name__ == '__main__':
+    from ursina import *
+    import numpy
+    app = Ursina()
+
+    n = 100000
+    grass = EntityArray(model='quad', count=n, texture='white_cube')
+    grass.positions[:, (0,2)] = numpy.random.uniform(-50, 50, (n, 2))
+    grass.scales[:] = (.1, .5, .1)
+    grass.rotations[:, 1] = numpy.random.uniform(0, 360, n)
+    grass.colors[:] = color.lime
+    grass.colors[:, :3] *= numpy.random.uniform(.5, 1, (n, 1))
+    grass.apply()
+
+    def update():
+        grass.rotations[:, 2] = numpy.sin(time.time() + grass.positions[:, 0]) * 10    # sway in the wind
+        grass.apply()
+
+    promoted = grass.promote(0, collider='box', on_click=lambda: print('clicked'))
+    promoted.color = color.red
+    EditorCamera()
+    app.run()
@@ -0,0 +1,107 @@
+from ursina import application
+from ursina import timers
+
+
+# reuses entities instead of creating and destroying them, for things like bullets and particles.
+# prefab is a function returning a new entity, like a class or lambda: duplicate(bullet).
+# released entities get disabled, so they don't get update() or input() while waiting in the pool.
+# if the entity has an on_reuse() method, it gets called before it's handed out again. use it to reset its state.
+class EntityPool():
+
+    def __init__(self, prefab, size=0):
+        self.prefab = prefab
+        # entity : None, insertion ordered, so they work as O(1) ordered sets
+        self.free = dict()      # disabled entities, ready to be reused. popitem() gives the last released one.
+        self.in_use = dict()
+
+        for i in range(size):
+            self.free[self._create()] = None
+
+
+    def _create(self):
+        e = self.prefab()
+        e.enabled = False
+        e._entity_pool = self   # so destroy() can take it out of the pool
+        return e
+
+
+    def _forget(self, entity):  # called by destroy(), before the NodePath gets removed and its hash changes
+        self.in_use.pop(entity, None)
+        self.free.pop(entity, None)
+
+
+    def get(self, **kwargs):    # kwargs are set on the entity, like pool.get(position=(1,2,3), color=color.red)
+        if self.free:
+            e = self.free.popitem()[0]
+            if hasattr(e, 'on_reuse'):
+                e.on_reuse()
+        else:
+            e = self._create()
+
+        for key, value in kwargs.items():
+            setattr(e, key, value)
+
+        e.enabled = True
+        self.in_use[e] = None
+        return e
+
+
+    def release(self, entity, delay=0):  # use instead of destroy()
+        if delay:
+            return timers.call_later(delay, self.release, entity)
+
+        if entity.is_empty() or entity not in self.in_use:  # destroyed, or not from this pool
+            return
+
+        del self.in_use[entity]
+        for anim in entity.animations:
+            anim.kill()
+        entity.animations.clear()
+
+        entity.enabled = False
+        self.free[entity] = None
+
+
+    def release_all(self):
+        for e in list(self.in_use):
+            self.release(e)
+
+
+    def clear(self):    # destroys all the entities, both free and in use
+        from ursina.ursinastuff import destroy
+        for e in list(self.free) + list(self.in_use):
+            destroy(e)
+
+        self.free.clear()
+        self.in_use.clear()
+
+
+    def __len__(self):
+        return len(self.free) + len(self.in_use)
+
+
+
+if __name__ == '__main__':
+    from ursina import *
+    app = Ursina()
+
+    class Bullet(Entity):
+        def __init__(self):
+            super().__init__(model='sphere', color=color.orange, scale=.2, collider='sphere')
+
+        def on_reuse(self):
+            self.color = color.orange
+
+        def update(self):
+            self.y += 10 * time.dt
+
+    bullets = EntityPool(Bullet, size=50)
+
+    def input(key):
+        if key == 'space':
+            bullet = bullets.get(position=(random.uniform(-5,5), -4, 0))
+            bullet.animate_color(color.red, duration=.5)
+            bullets.release(bullet, delay=1)
+
+    Text('press space to shoot', y=.4, origin=(0,0))
+    app.run()
@@ -0,0 +1,222 @@
+import itertools
+
+
+# used for scene.entities. works like a list, but adding, removing and 'entity in scene.entities' are O(1).
+# iterating goes over a snapshot, so destroying entities in the loop is fine. destroyed ones get skipped.
+# every entity gets an entity_id when added, which stays the same until the program closes.
+# it also keeps indexes by name, class and tag, so find_all() only has to look at the entities that match.
+class EntityRegistry():
+
+    def __init__(self, entities=()):
+        self._entities = dict()     # entity : entity_id, in the order they got added
+        self._by_id = dict()        # entity_id : entity
+        self._snapshot = None       # tuple of the entities, rebuilt when needed after something changed
+        self._ids = itertools.count()
+
+        self._names = dict()        # name : {entity : None}
+        self._types = dict()        # class : {entity : None}
+        self._tags = dict()         # tag : {entity : None}
+        self._unresolved_names = dict()     # entities that get named after the line that made them, once someone asks for the name
+        self.extend(entities)
+
+
+    def append(self, entity):
+        if entity in self._entities:
+            return
+
+        entity_id = getattr(entity, 'entity_id', None)
+        if entity_id is None:
+            entity_id = next(self._ids)
+            entity.entity_id = entity_id
+
+        self._entities[entity] = entity_id
+        self._by_id[entity_id] = entity
+        self._snapshot = None
+
+        self._names.setdefault(entity.getName(), dict())[entity] = None
+        self._types.setdefault(entity.__class__, dict())[entity] = None
+        for tag in getattr(entity, '_tags', ()):
+            self._tags.setdefault(tag, dict())[entity] = None
+
+
+    def extend(self, entities):
+        for e in entities:
+            self.append(e)
+
+
+    def remove(self, entity):
+        if entity not in self._entities:
+            raise ValueError(f'{entity} not in scene.entities')
+        self.discard(entity)
+
+
+    def discard(self, entity):
+        entity_id = self._entities.pop(entity, None)
+        if entity_id is None:
+            return
+
+        del self._by_id[entity_id]
+        self._snapshot = None
+
+        self._unindex(self._names, entity.getName(), entity)
+        self._unindex(self._types, entity.__class__, entity)
+        for tag in getattr(entity, '_tags', ()):
+            self._unindex(self._tags, tag, entity)
+        self._unresolved_names.pop(entity, None)
+
+
+    def clear(self):
+        self._entities.clear()
+        self._by_id.clear()
+        self._snapshot = None
+        self._names.clear()
+        self._types.clear()
+        self._tags.clear()
+        self._unresolved_names.clear()
+
+
+    def _unindex(self, index, key, entity):
+        entities = index.get(key)
+        if entities is not None:
+            entities.pop(entity, None)
+            if not entities:
+                del index[key]
+
+
+    # called by Entity when its name or tags change
+    def _rename(self, entity, old_name):
+        if entity in self._entities:
+            self._unindex(self._names, old_name, entity)
+            self._names.setdefault(entity.getName(), dict())[entity] = None
+
+    def _name_later(self, entity):
+        self._unresolved_names[entity] = None
+
+    def _add_tag(self, entity, tag):
+        if entity in self._entities:
+            self._tags.setdefault(tag, dict())[entity] = None
+
+    def _remove_tag(self, entity, tag):
+        if entity in self._entities:
+            self._unindex(self._tags, tag, entity)
+
+
+    def find_all(self, name=None, type=None, tag=None):
+        # type can be a class, which includes subclasses, or a class name.
+        # looks through the smallest of the matching groups, so it's O(k) instead of O(len(scene.entities)).
+        groups = list()
+        if name is not None:
+            for e in tuple(self._unresolved_names):
+                e.name  # resolves the name
+            self._unresolved_names.clear()
+            groups.append(self._names.get(name, dict()))
+
+        if tag is not None:
+            groups.append(self._tags.get(tag, dict()))
+
+        if type is not None:
+            if isinstance(type, str):
+                classes = [c for c in self._types if type in [e.__name__ for e in c.__mro__]]
+            else:
+                classes = [c for c in self._types if issubclass(c, type)]
+
+            if len(classes) == 1:
+                groups.append(self._types[classes[0]])
+            else:
+                group = dict()
+                for c in classes:
+                    group.update(self._types[c])
+                groups.append(group)
+
+        if not groups:
+            return list(self)
+
+        if len(groups) == 1:
+            return list(groups[0])
+
+        smallest = min(groups, key=len)
+        return [e for e in smallest if all(e in group for group in groups)]
+
+
+    def find(self, name=None, type=None, tag=None):    # returns the first match or None
+        matches = self.find_all(name=name, type=type, tag=tag)
+        if matches:
+            return matches[0]
+        return None
+
+
+    def entity_of(self, node_path):  # get the Entity for a NodePath, like the one hit by a raycast. None if it isn't one.
+        entity_id = self._entities.get(node_path)
+        if entity_id is None:
+            return None
+        return self._by_id[entity_id]
+
+
+    def get(self, entity_id, default=None):
+        return self._by_id.get(entity_id, default)
+
+
+    def _get_snapshot(self):
+        if self._snapshot is None:
+            self._snapshot = tuple(self._entities)
+        return self._snapshot
+
+
+    def __iter__(self):
+        entities = self._entities
+        for e in self._get_snapshot():
+            if e in entities:
+                yield e
+
+    def __reversed__(self):
+        entities = self._entities
+        for e in reversed(self._get_snapshot()):
+            if e in entities:
+                yield e
+
+    def __contains__(self, entity):
+        return entity in self._entities
+
+    def __len__(self):
+        return len(self._entities)
+
+    def __bool__(self):
+        return bool(self._entities)
+
+    def __getitem__(self, index):   # for code using scene.entities as a list. O(1) until entities get added or removed.
+        if isinstance(index, slice):
+            return list(self._get_snapshot()[index])
+        return self._get_snapshot()[index]
+
+    def index(self, entity):
+        if entity not in self._entities:
+            raise ValueError(f'{entity} not in scene.entities')
+        return self._get_snapshot().index(entity)
+
+    def count(self, entity):
+        return int(entity in self._entities)
+
+    def copy(self):
+        return list(self._entities)
+
+    def __add__(self, other):
+        return list(self._entities) + list(other)
+
+    def __repr__(self):
+        return f'EntityRegistry({list(self._entities)})'
+
+
+
+if __name__ == '__main__':
+    from ursina import *
+    app = Ursina()
+
+    bullets = [Entity(model='sphere', scale=.1, x=i*.2) for i in range(10)]
+    print(len(scene.entities), bullets[0] in scene.entities, scene.entities.get(bullets[0].entity_id) == bullets[0])
+
+    for e in scene.entities:    # destroying while iterating is fine
+        if e in bullets:
+            destroy(e)
+
+    print(len(scene.entities), scene.entities[-1])
+    app.run()
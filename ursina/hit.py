@@ -6,6 +6,7 @@ class Hit():
         super().__init__()
         self.hit = None
         self.entity = None
+        self.instance = None    # the InstancedEntity that got hit, if the entity is an Instancer
         self.point = None
         self.world_point = None
         self.distance = math.inf
@@ -0,0 +1,283 @@
+from panda3d.core import Texture, GeomEnums, OmniBoundingVolume, CollisionNode, CollisionBox, CollisionSphere, Mat4, Point3, TransformState
+from ursina.entity import Entity
+from ursina.entity_array import rotation_matrices
+from ursina.mesh import Mesh
+from ursina.mesh_importer import load_model
+from ursina.shaders.instancing import instancing_shader
+from ursina.vec3 import Vec3
+from ursina.color import Color
+from ursina import application
+
+
+# one of the copies drawn by an Instancer. works like a small Entity with position, rotation, scale and color.
+# setting one of them only updates this instance. index changes when other instances get removed, so keep the InstancedEntity instead.
+class InstancedEntity():
+
+    def __init__(self, instancer, index):
+        self.instancer = instancer
+        self.index = index
+        self.collider = None    # collision node for mouse and raycast hits, if the Instancer has instance_collider set
+
+    @property
+    def position(self):
+        return Vec3(*self.instancer._positions[self.index].tolist())
+
+    @position.setter
+    def position(self, value):
+        self.instancer._positions[self.index] = tuple(value)
+        self.instancer._write_row(self.index)
+
+    @property
+    def rotation(self):
+        return Vec3(*self.instancer._rotations[self.index].tolist())
+
+    @rotation.setter
+    def rotation(self, value):
+        self.instancer._rotations[self.index] = tuple(value)
+        self.instancer._write_row(self.index)
+
+    @property
+    def scale(self):
+        return Vec3(*self.instancer._scales[self.index].tolist())
+
+    @scale.setter
+    def scale(self, value):
+        if isinstance(value, (int, float)):
+            value = (value, value, value)
+        self.instancer._scales[self.index] = tuple(value)
+        self.instancer._write_row(self.index)
+
+    @property
+    def color(self):
+        return Color(*self.instancer._colors[self.index].tolist())
+
+    @color.setter
+    def color(self, value):
+        self.instancer._colors[self.index] = tuple(value)
+        self.instancer._write_row(self.index)
+
+    def __repr__(self):
+        return f'InstancedEntity({self.index})'
+
+
+# draws one model many times with hardware instancing, in one draw call. for blocks, trees, tiles and so on.
+# add() and remove() instances one by one, or change positions, rotations, scales and colors all at once with numpy and call apply().
+# set instance_collider to 'box' or 'sphere' to get mouse.hovered_instance and raycast(...).instance for the instance that got hit.
+# needs numpy and OpenGL 3.1 for the shader.
+class Instancer(Entity):
+
+    def __init__(self, model='cube', capacity=64, instance_collider=None, **kwargs):
+        import numpy
+        super().__init__()
+        if isinstance(model, str):
+            name = model
+            model = load_model(name, application.asset_folder)
+            if not model:
+                model = load_model(name, application.internal_models_folder)
+        if not isinstance(model, Mesh):
+            raise ValueError(f'Instancer needs a Mesh or the name of one, got: {model}')
+
+        self.model = model
+        self.model.node().setBounds(OmniBoundingVolume())   # the instances can be anywhere, so don't cull them with the bounds of the model
+        self.model.node().setFinal(True)
+        self.shader = instancing_shader
+
+        self.count = 0
+        self.capacity = 0
+        self.instances = list()     # InstancedEntity for each row, in the same order as the arrays
+        # in ursina's axes, like entity.position, entity.rotation, entity.scale and entity.color
+        self._positions = numpy.zeros((0, 3), dtype=numpy.float32)
+        self._rotations = numpy.zeros((0, 3), dtype=numpy.float32)
+        self._scales = numpy.ones((0, 3), dtype=numpy.float32)
+        self._colors = numpy.ones((0, 4), dtype=numpy.float32)
+
+        self.instance_collider = instance_collider
+        if instance_collider:
+            vertices = numpy.asarray(model.vertices, dtype=numpy.float32).reshape(-1, 3)[:, (0,2,1)]
+            low, high = vertices.min(axis=0), vertices.max(axis=0)
+            if instance_collider == 'box':
+                self._collision_shape = CollisionBox(Point3(*low.tolist()), Point3(*high.tolist()))
+            elif instance_collider == 'sphere':
+                self._collision_shape = CollisionSphere(*((low + high) / 2).tolist(), float(numpy.linalg.norm(high - low) / 2))
+            else:
+                raise ValueError(f"instance_collider should be 'box', 'sphere' or None, got: {instance_collider}")
+            self.collision = True
+
+        self._texture = Texture('instance_data')
+        self._grow(capacity)
+
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+
+    # the arrays of the instances in use. change them all at once and call apply(), like instancer.positions[:,1] += 1
+    @property
+    def positions(self):
+        return self._positions[:self.count]
+
+    @positions.setter
+    def positions(self, value):
+        self._positions[:self.count] = value
+
+    @property
+    def rotations(self):
+        return self._rotations[:self.count]
+
+    @rotations.setter
+    def rotations(self, value):
+        self._rotations[:self.count] = value
+
+    @property
+    def scales(self):
+        return self._scales[:self.count]
+
+    @scales.setter
+    def scales(self, value):
+        self._scales[:self.count] = value
+
+    @property
+    def colors(self):
+        return self._colors[:self.count]
+
+    @colors.setter
+    def colors(self, value):
+        self._colors[:self.count] = value
+
+
+    def _grow(self, capacity):
+        # double the arrays and the buffer texture when they're full, so add() stays O(1) on average
+        import numpy
+        capacity = max(capacity, 1)
+        for name, fill, width in (('_positions', 0, 3), ('_rotations', 0, 3), ('_scales', 1, 3), ('_colors', 1, 4)):
+            old = getattr(self, name)
+            new = numpy.full((capacity, width), fill, dtype=numpy.float32)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+        self.capacity = capacity
+        self._texture.setup_buffer_texture(capacity * 4, Texture.T_float, Texture.F_rgba32, GeomEnums.UH_dynamic)
+        self.set_shader_input('instance_data', self._texture)
+        self._write_rows(0, self.count)
+
+
+    def add(self, position=(0,0,0), rotation=(0,0,0), scale=(1,1,1), color=(1,1,1,1)):   # returns an InstancedEntity
+        if self.count == self.capacity:
+            self._grow(self.capacity * 2)
+
+        i = self.count
+        if isinstance(scale, (int, float)):
+            scale = (scale, scale, scale)
+        self._positions[i], self._rotations[i], self._scales[i], self._colors[i] = tuple(position), tuple(rotation), tuple(scale), tuple(color)
+        instance = InstancedEntity(self, i)
+        self.instances.append(instance)
+        self.count += 1
+
+        if self.instance_collider:
+            instance.collider = self.attach_new_node(CollisionNode('instance_collider'))
+            instance.collider.node().add_solid(self._collision_shape)
+            instance.collider.set_python_tag('instance', instance)
+
+        self._write_row(i)
+        self.model.setInstanceCount(self.count)
+        return instance
+
+
+    def remove(self, instance):
+        # moves the last instance into the removed one's place, so it's O(1). that instance gets a new index.
+        i, last = instance.index, self.count - 1
+        if self.instances[i] is not instance:
+            raise ValueError(f'{instance} is not in {self}')
+
+        if i != last:
+            for array in (self._positions, self._rotations, self._scales, self._colors):
+                array[i] = array[last]
+            moved = self.instances[last]
+            moved.index = i
+            self.instances[i] = moved
+
+        self.instances.pop()
+        self.count -= 1
+        if instance.collider:
+            instance.collider.removeNode()
+            instance.collider = None
+        instance.index = None
+
+        if i != last:
+            self._write_row(i)
+        self.model.setInstanceCount(self.count)
+
+
+    def clear(self):
+        for instance in self.instances:
+            if instance.collider:
+                instance.collider.removeNode()
+            instance.index = None
+        self.instances.clear()
+        self.count = 0
+        self.model.setInstanceCount(0)
+
+
+    def apply(self):    # upload all the positions, rotations, scales and colors. call after changing the arrays.
+        self._write_rows(0, self.count)
+
+
+    def _write_row(self, i):
+        # one instance, with panda doing the math, since numpy has too much overhead for a single row
+        import numpy
+        x, y, z = self._positions[i].tolist()
+        rx, ry, rz = self._rotations[i].tolist()
+        sx, sy, sz = [e if e != 0 else .001 for e in self._scales[i].tolist()]
+        m = TransformState.make_pos_hpr_scale((x, z, y), (-ry, -rx, rz), (sx, sz, sy)).get_mat()
+
+        data = numpy.frombuffer(self._texture.modify_ram_image(), dtype=numpy.float32).reshape(self.capacity, 4, 4)
+        data[i, :3] = [(m[0][c], m[1][c], m[2][c], m[3][c]) for c in range(3)]
+        data[i, 3] = self._colors[i]
+        if self.instance_collider:
+            self.instances[i].collider.set_mat(m)
+
+
+    def _write_rows(self, start, end):
+        import numpy
+        if end <= start:
+            return
+
+        scales = self._scales[start:end, (0,2,1)]
+        scales = numpy.where(scales == 0, .001, scales)
+        matrices = rotation_matrices(self._rotations[start:end]) * scales[:, :, None]     # scale, then rotate, as row vectors
+        positions = self._positions[start:end, (0,2,1)]
+
+        # a new view each time, since panda can swap the ram image for a copy while it's being uploaded
+        data = numpy.frombuffer(self._texture.modify_ram_image(), dtype=numpy.float32).reshape(self.capacity, 4, 4)
+        data[start:end, :3, :3] = matrices.transpose(0, 2, 1)   # the shader dots each row with the vertex
+        data[start:end, :3, 3] = positions
+        data[start:end, 3] = self._colors[start:end]
+
+        if self.instance_collider:
+            for i in range(start, end):
+                m, p = matrices[i-start].tolist(), positions[i-start].tolist()
+                self.instances[i].collider.set_mat(Mat4(*m[0], 0, *m[1], 0, *m[2], 0, *p, 1))
+
+
+
+if __name__ == '__main__':
+    from ursina import *
+    import numpy
+    app = Ursina()
+
+    blocks = Instancer(model='cube', texture='white_cube', instance_collider='box')
+    for z in range(64):
+        for x in range(64):
+            blocks.add(position=(x, 0, z), color=color.random_color())
+
+    def input(key):
+        if key == 'left mouse down' and mouse.hovered_instance:
+            blocks.remove(mouse.hovered_instance)
+        if key == 'right mouse down' and mouse.hovered_instance:
+            mouse.hovered_instance.color = color.red
+
+    def update():
+        blocks.positions[:, 1] = numpy.sin(time.time() + blocks.positions[:, 0] * .2) * .5  # all at once with numpy
+        blocks.apply()
+
+    EditorCamera()
+    app.run()
@@ -0,0 +1,87 @@
+import time
+import queue
+import traceback
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+
+# runs slow functions on worker threads or processes. on_done gets called on the main thread by Ursina._update,
+# so it's safe to create entities and change the scene there. use process=True for pure python number crunching,
+# the function, arguments and result must then be picklable.
+class Jobs():
+
+    def __init__(self):
+        self.max_workers = None     # None lets concurrent.futures decide
+        self.time_budget = .004     # seconds per frame to spend on on_done callbacks. the rest waits until next frame.
+        self._thread_pool = None
+        self._process_pool = None
+        self._finished = queue.SimpleQueue()   # (future, on_done, on_error), filled from the worker threads
+        self.pending = 0
+
+
+    def submit(self, function, *args, on_done=None, on_error=None, process=False, **kwargs):
+        if process:
+            if not self._process_pool:
+                self._process_pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            pool = self._process_pool
+        else:
+            if not self._thread_pool:
+                self._thread_pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='ursina_job')
+            pool = self._thread_pool
+
+        future = pool.submit(function, *args, **kwargs)
+        self.pending += 1
+        future.add_done_callback(lambda f: self._finished.put((f, on_done, on_error)))
+        return future
+
+
+    def update(self):   # called by Ursina._update
+        if not self.pending:
+            return
+
+        start = time.perf_counter()
+        while time.perf_counter() - start < self.time_budget:
+            try:
+                future, on_done, on_error = self._finished.get_nowait()
+            except queue.Empty:
+                return
+
+            self.pending -= 1
+            if future.cancelled():
+                continue
+
+            error = future.exception()
+            if error:
+                if on_error:
+                    on_error(error)
+                else:
+                    traceback.print_exception(type(error), error, error.__traceback__)
+                continue
+
+            if on_done:
+                on_done(future.result())
+
+
+    def shutdown(self, wait=True):
+        for pool in (self._thread_pool, self._process_pool):
+            if pool:
+                pool.shutdown(wait=wait)
+
+        self._thread_pool = None
+        self._process_pool = None
+
+
+
+if __name__ == '__main__':
+    from ursina import *
+    app = Ursina()
+
+    def make_wave(resolution):     # runs on a worker thread, so only compute data here
+        import math
+        return [Vec3(x/resolution, math.sin(x/4)/10, 0) for x in range(resolution)]
+
+    def on_done(vertices):   # runs on the main thread
+        Entity(model=Mesh(vertices=vertices, mode='line'), x=-.5, color=color.orange)
+
+    application.jobs.submit(make_wave, 100000, on_done=on_done)
+    EditorCamera()
+    app.run()
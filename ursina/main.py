@@ -1,12 +1,28 @@
 import time
 from ursina.ursinastuff import *
+from panda3d.core import Quat, ClockObject, MouseWatcher, ButtonThrower
 import __main__
+from ursina import coroutines
+from ursina import timers
+
+
+def _call(profiler, category, owner, function, *args):     # through the FrameProfiler when it's on, so the time gets counted
+    if profiler:
+        profiler.call(category, owner, function, *args)
+    else:
+        function(*args)
 
 
 class Ursina(ShowBase):
     
     def __init__(self, init_showbase=True, base_=None, disable_pause=False,
-    render_pipeline = None):
+    render_pipeline = None, headless=False):
+        application.headless = headless
+        if headless:    # no window, for running on build machines without a display. advance the game with app.step().
+            loadPrcFileData('', 'window-type offscreen')
+            loadPrcFileData('', 'audio-library-name null')
+            loadPrcFileData('', f'win-size {int(window.size[0])} {int(window.size[1])}')
+
         if (render_pipeline and init_showbase):
             render_pipeline.pre_showbase_init()
             ShowBase.__init__(self)
@@ -48,6 +64,11 @@ class Ursina(ShowBase):
             camera.overlay = window.overlay
         
         # input
+        if headless:    # an offscreen buffer has no mouse or keyboard, so make stand-ins for them
+            base.mouseWatcherNode = MouseWatcher()
+            base.mouseWatcher = NodePath(base.mouseWatcherNode)
+            base.buttonThrowers = [NodePath(ButtonThrower('button_thrower')), ]
+
         base.buttonThrowers[0].node().setButtonDownEvent('buttonDown')
         base.buttonThrowers[0].node().setButtonUpEvent('buttonUp')
         base.buttonThrowers[0].node().setButtonRepeatEvent('buttonHold')
@@ -104,10 +125,15 @@ class Ursina(ShowBase):
         self.mouse = mouse
 
         scene.set_up()
+        time.dt = 0
+        self._time = 0  # scaled time since start, used for entities with update_rate
+        self._update_rate_cursors = dict()  # update_rate : [entities in the order they get updated, index of the next one, updates owed]
+        self._fixed_time_left = 0   # time not yet simulated by fixed_update, carried over to the next frame
         self._update_task = taskMgr.add(self._update, "update")
 
         from ursina import HotReloader
-        application.hot_reloader = HotReloader(__main__.__file__)
+        if hasattr(__main__, '__file__'):   # not when running from an interactive shell
+            application.hot_reloader = HotReloader(__main__.__file__)
 
         # try to load settings that need to be applied before entity creation
         try:
@@ -124,35 +150,179 @@ class Ursina(ShowBase):
         # time between frames
         dt = globalClock.getDt() * application.time_scale
         time.dt = dt
+        self._time += dt
 
-        mouse.update()
+        profiler = application.profiler
+        if profiler:
+            profiler.new_frame()
+        _call(profiler, 'mouse', mouse, mouse.update)
+
+        if application.fixed_timestep:
+            self._fixed_update(dt)
 
         if hasattr(__main__, 'update') and not application.paused:
-            __main__.update()
+            _call(profiler, 'update', __main__, __main__.update)
 
         for seq in application.sequences:
-            seq.update()
-
-        for entity in scene.entities:
-            if entity.enabled == False or entity.ignore:
+            _call(profiler, 'sequence', seq, seq.update)
+
+        _call(profiler, 'timers', timers, timers.update, dt)
+        _call(profiler, 'coroutines', coroutines, coroutines.update, dt)
+        _call(profiler, 'jobs', application.jobs, application.jobs.update)
+
+        # only entities with an update function or scripts with an update function are in the registry.
+        # disabled and destroyed entities get removed from it, so check again in case that happened this frame.
+        update_registry = scene.update_registry
+        for entity in tuple(update_registry):
+            entry = update_registry.get(entity)
+            if entry is None or entity.ignore:
                 continue
 
             if application.paused and entity.ignore_paused == False:
                 continue
 
-            if hasattr(entity, 'update'):
-                entity.update()
+            has_update, scripts = entry
+            if has_update:
+                _call(profiler, 'update', entity, entity.update)
 
+            for script in scripts:
+                if script.enabled:
+                    _call(profiler, 'script update', script, script.update)
 
-            if hasattr(entity, 'scripts'):
-                for script in entity.scripts:
-                    if script.enabled and hasattr(script, 'update'):
-                        script.update()
+        for update_rate, registry in tuple(scene.update_rate_registry.items()):
+            self._update_at_rate(update_rate, registry, dt)
 
 
         return Task.cont
 
 
+    def _update_at_rate(self, update_rate, registry, dt):
+        # spread the entities out over the frames, so only a part of them get updated each frame.
+        # time.dt will be the time since the entity got updated last.
+        order, i, owed = self._update_rate_cursors.get(update_rate, (list(), 0, 0))
+        owed = min(owed + len(registry) * update_rate * dt, len(registry))
+        count = int(owed)
+        owed -= count
+        frame_dt = time.dt
+        profiler = application.profiler
+
+        for _ in range(count):
+            if i >= len(order):     # start over, picking up new entities
+                order = list(registry)
+                i = 0
+                if not order:
+                    break
+
+            entity = order[i]
+            i += 1
+            entry = registry.get(entity)
+            if entry is None:
+                continue
+
+            time.dt = self._time - getattr(entity, '_last_update_time', self._time - (1 / update_rate))
+            entity._last_update_time = self._time
+            if entity.ignore or (application.paused and entity.ignore_paused == False):
+                continue
+
+            has_update, scripts = entry
+            if has_update:
+                _call(profiler, 'update', entity, entity.update)
+
+            for script in scripts:
+                if script.enabled:
+                    _call(profiler, 'script update', script, script.update)
+
+        time.dt = frame_dt
+        self._update_rate_cursors[update_rate] = [order, i, owed]
+
+
+    def _fixed_update(self, dt):
+        # call fixed_update() as many times as needed to catch up with the time passed, but no more than application.max_fixed_steps.
+        registry = scene.fixed_update_registry
+        step = application.fixed_timestep
+        interpolate = application.interpolate_fixed_timestep
+
+        if interpolate:
+            for entity in registry:
+                self._restore_simulated_transform(entity)
+
+        self._fixed_time_left += dt
+        frame_dt = time.dt
+        time.dt = step
+        steps = 0
+        profiler = application.profiler
+
+        while self._fixed_time_left >= step - 1e-9 and steps < application.max_fixed_steps:    # allow for floating point error, so the step count won't depend on the frame rate
+            if interpolate:
+                for entity in registry:
+                    entity._fixed_transforms = [entity.getTransform(), ] * 3
+
+            if hasattr(__main__, 'fixed_update') and not application.paused:
+                _call(profiler, 'fixed_update', __main__, __main__.fixed_update)
+
+            for entity in tuple(registry):
+                entry = registry.get(entity)
+                if entry is None or entity.ignore:
+                    continue
+                if application.paused and entity.ignore_paused == False:
+                    continue
+
+                has_fixed_update, scripts = entry
+                if has_fixed_update:
+                    _call(profiler, 'fixed_update', entity, entity.fixed_update)
+
+                for script in scripts:
+                    if script.enabled:
+                        _call(profiler, 'script fixed_update', script, script.fixed_update)
+
+            self._fixed_time_left -= step
+            steps += 1
+
+        if steps == application.max_fixed_steps:   # drop the time we couldn't catch up with
+            self._fixed_time_left = min(self._fixed_time_left, step)
+
+        time.dt = frame_dt
+
+        if interpolate:
+            t = max(self._fixed_time_left / step, 0)
+            for entity in registry:
+                if hasattr(entity, '_fixed_transforms'):
+                    previous, simulated, rendered = entity._fixed_transforms
+                    if steps:
+                        simulated = entity.getTransform()
+
+                    q = simulated.getQuat()
+                    if previous.getQuat().dot(q) < 0:  # take the short way around
+                        q = -q
+
+                    entity.setPosQuatScale(
+                        previous.getPos() + (simulated.getPos() - previous.getPos()) * t,
+                        Quat((previous.getQuat() + (q - previous.getQuat()) * t).normalized()),
+                        previous.getScale() + (simulated.getScale() - previous.getScale()) * t,
+                        )
+                    entity._fixed_transforms = [previous, simulated, entity.getTransform()]
+
+
+    def _restore_simulated_transform(self, entity):
+        # put entities back where the simulation left them, unless something else moved them after they got interpolated.
+        # position, rotation and scale are checked one by one, so for example setting rotation in update() won't keep the interpolated position.
+        if not hasattr(entity, '_fixed_transforms'):
+            return
+
+        simulated, rendered = entity._fixed_transforms[1:]
+        current = entity.getTransform()
+        if current == rendered:
+            entity.setTransform(simulated)
+            return
+
+        if current.getPos() == rendered.getPos():
+            entity.setPos(simulated.getPos())
+        if current.getQuat() == rendered.getQuat():
+            entity.setQuat(simulated.getQuat())
+        if current.getScale() == rendered.getScale():
+            entity.setScale(simulated.getScale())
+
+
     def input_up(self, key):
         if key in  ('wheel_up', 'wheel_down'):
             return
@@ -193,19 +363,23 @@ class Ursina(ShowBase):
             except: pass
 
 
-        for entity in scene.entities:
-            if entity.enabled == False or entity.ignore or entity.ignore_input:
-                continue
-            if application.paused and entity.ignore_paused == False:
+        profiler = application.profiler
+        # entities without input_keys get every key, the others are looked up by key.
+        # check the registry again before calling, in case the entity got disabled or destroyed by an earlier handler.
+        for registry in (scene.input_registry, scene.input_key_registry.get(key)):
+            if not registry:
                 continue
 
-            if hasattr(entity, 'input'):
-                entity.input(key)
+            for entity in tuple(registry):
+                handlers = registry.get(entity)
+                if handlers is None or entity.ignore or entity.ignore_input:
+                    continue
+                if application.paused and entity.ignore_paused == False:
+                    continue
 
-            if hasattr(entity, 'scripts'):
-                for script in entity.scripts:
-                    if script.enabled and hasattr(script, 'input'):
-                        script.input(key)
+                for handler in handlers:
+                    if handler is entity or handler.enabled:
+                        _call(profiler, 'input', handler, handler.input, key)
 
 
         if key == 'f11':
@@ -229,6 +403,17 @@ class Ursina(ShowBase):
                 application.resume()
 
 
+    def step(self, n_frames=1, dt=None):
+        # run n frames without entering the main loop, for tests and benchmarks.
+        # if dt is set, every frame will take exactly that long from now on, so the results don't depend on how fast the computer is.
+        if dt is not None:
+            globalClock.setMode(ClockObject.MNonRealTime)
+            globalClock.setDt(dt)
+
+        for i in range(n_frames):
+            taskMgr.step()
+
+
     def run(self):
         if window.show_ursina_splash:
             from ursina.prefabs import ursina_splash
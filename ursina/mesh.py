@@ -32,6 +32,30 @@ class MeshModes(Enum):
 
 
 
+def _is_array(value):   # numpy arrays and other buffers, like array.array
+    return value is not None and not isinstance(value, (list, tuple))
+
+def _has_data(value):
+    return value is not None and len(value) > 0
+
+def _rows_dtype(vdata):    # numpy dtype with the same layout as a row in the vertex buffer
+    import numpy
+    array_format = vdata.getFormat().getArray(0)
+    columns = [array_format.getColumn(i) for i in range(array_format.getNumColumns())]
+    return numpy.dtype({
+        'names' : [c.getName().getName() for c in columns],
+        'formats' : [(numpy.uint8 if c.getNumericType() == Geom.NT_uint8 else numpy.float32, (c.getNumComponents(), )) for c in columns],
+        'offsets' : [c.getStart() for c in columns],
+        'itemsize' : array_format.getStride(),
+        })
+
+def _as_rows(value, width):
+    if _is_array(value):
+        import numpy
+        return [tuple(e) for e in numpy.asarray(value).reshape(-1, width).tolist()]
+    return [tuple(e) for e in value]
+
+
 class Mesh(NodePath):
 
     _formats = {
@@ -53,6 +77,7 @@ class Mesh(NodePath):
         'point' : GeomPoints,
         }
     vdata=None
+    _recipe=None
     def __init__(self, vertices=None, triangles=None, colors=None, uvs=None, normals=None, static=True, mode='triangle', thickness=1):
         super().__init__('mesh')
 
@@ -70,25 +95,32 @@ class Mesh(NodePath):
             if value is None:
                 setattr(self, name, list())
 
-        if self.vertices:
-            self.vertices = [tuple(v) for v in self.vertices]
+        if len(self.vertices):
+            if isinstance(self.vertices, (list, tuple)):
+                self.vertices = [tuple(v) for v in self.vertices]
             self.generate()
 
 
     def generate(self):  # call this after setting some of the variables to update it
         #print("Generating Mesh")
+        self._recipe = None
         if hasattr(self, 'geomNode'):
             self.geomNode.removeAllGeoms()
         if (self.vdata):
             self.vdata.clearRows()
         static_mode = Geom.UHStatic if self.static else Geom.UHDynamic
-        vertex_format = Mesh._formats[(bool(self.colors), bool(self.uvs), bool(self.normals))]
+        vertex_format = Mesh._formats[(_has_data(self.colors), _has_data(self.uvs), _has_data(self.normals))]
         self.vdata = GeomVertexData('name', vertex_format, static_mode)
-        self.vdata.setNumRows(len(self.vertices)) # for speed
         vdata = self.vdata
         self.geomNode = GeomNode('mesh')
         self.attachNewNode(self.geomNode)
 
+        # numpy arrays and other buffers get copied in all at once, lists get written one vertex at a time
+        if any(_is_array(e) for e in (self.vertices, self.colors, self.uvs, self.normals, self._triangles)):
+            if self._generate_from_arrays(vdata, static_mode):
+                return
+
+        self.vdata.setNumRows(len(self.vertices)) # for speed
         vertexwriter = GeomVertexWriter(vdata, 'vertex')
         for v in self.vertices:
             vertexwriter.addData3f((v[0], v[2], v[1])) # swap y and z
@@ -108,17 +140,20 @@ class Mesh(NodePath):
             for norm in self.normals:
                 normalwriter.addData3f((norm[0], norm[2], norm[1]))
 
+        self._add_primitives(vdata, static_mode, self._triangles)
+
 
-        if self.mode != 'line' or not self._triangles:
+    def _add_primitives(self, vdata, static_mode, triangles):
+        if self.mode != 'line' or not triangles:
             prim = Mesh._modes[self.mode](static_mode)
 
-            if self._triangles:
-                if isinstance(self._triangles[0], int):
-                    for t in self._triangles:
+            if triangles:
+                if isinstance(triangles[0], int):
+                    for t in triangles:
                         prim.addVertex(t)
 
-                elif len(self._triangles[0]) >= 3: # if tris are tuples like this: ((0,1,2), (1,2,3))
-                    for t in self._triangles:
+                elif len(triangles[0]) >= 3: # if tris are tuples like this: ((0,1,2), (1,2,3))
+                    for t in triangles:
                         if len(t) == 3:
                             for e in t:
                                 prim.addVertex(e)
@@ -131,7 +166,7 @@ class Mesh(NodePath):
                             prim.addVertex(t[0])
 
             else:
-                prim.addConsecutiveVertices(0, len(self.vertices))
+                prim.addConsecutiveVertices(0, vdata.getNumRows())
 
             prim.close_primitive()
             geom = Geom(vdata)
@@ -139,7 +174,7 @@ class Mesh(NodePath):
             self.geomNode.addGeom(geom)
 
         else:   # line with segments defined in triangles
-            for line in self._triangles:
+            for line in triangles:
                 prim = Mesh._modes[self.mode](static_mode)
                 for e in line:
                     prim.addVertex(e)
@@ -149,24 +184,156 @@ class Mesh(NodePath):
                 self.geomNode.addGeom(geom)
 
 
-        self.recipe = dedent(f'''
+    def _generate_from_arrays(self, vdata, static_mode):
+        # fills a numpy array laid out like the vertex format and copies it into the vertex buffer through a memoryview.
+        # returns False if numpy isn't installed, so generate() can write the values one by one instead.
+        try:
+            import numpy
+        except ImportError:
+            return False
+
+        vertices = numpy.asarray(self.vertices, dtype=numpy.float32).reshape(-1, 3)
+        rows = numpy.zeros(len(vertices), dtype=_rows_dtype(vdata))
+
+        rows['vertex'] = vertices[:, (0,2,1)]  # swap y and z
+        if _has_data(self.colors):
+            colors = numpy.asarray(self.colors, dtype=numpy.float32).reshape(-1, 4)
+            if rows.dtype['color'].base == numpy.uint8:
+                colors = numpy.clip(colors * 255, 0, 255)
+            rows['color'] = colors
+        if _has_data(self.uvs):
+            rows['texcoord'] = numpy.asarray(self.uvs, dtype=numpy.float32).reshape(-1, 2)
+        if _has_data(self.normals):
+            rows['normal'] = numpy.asarray(self.normals, dtype=numpy.float32).reshape(-1, 3)[:, (0,2,1)]
+
+        vdata.uncleanSetNumRows(len(vertices))
+        memoryview(vdata.modifyArray(0)).cast('B')[:] = rows.view(numpy.uint8).ravel()
+
+        triangles = self._triangles
+        if not _has_data(triangles):
+            triangles = None
+        elif self.mode == 'line' or (isinstance(triangles, (list, tuple)) and not isinstance(triangles[0], int) and len(set(len(t) for t in triangles)) > 1):
+            # line segments and mixed tris and quads have rows of different lengths, so add them one at a time
+            self._add_primitives(vdata, static_mode, triangles.tolist() if _is_array(triangles) else triangles)
+            return True
+        else:
+            triangles = self._flat_triangle_array()
+
+        prim = Mesh._modes[self.mode](static_mode)
+        if triangles is None:
+            prim.addConsecutiveVertices(0, len(vertices))
+        else:
+            prim.setIndexType(Geom.NT_uint32)
+            prim.modifyVertices().uncleanSetNumRows(len(triangles))
+            memoryview(prim.modifyVertices()).cast('B').cast('I')[:] = triangles
+
+        prim.close_primitive()
+        geom = Geom(vdata)
+        geom.addPrimitive(prim)
+        self.geomNode.addGeom(geom)
+        return True
+
+
+    @property
+    def recipe(self):   # python code that makes this mesh, used by save(). only made when needed, since it's slow for big meshes.
+        if self._recipe is None:
+            self._recipe = self._make_recipe()
+        return self._recipe
+
+    @recipe.setter
+    def recipe(self, value):
+        self._recipe = value
+
+
+    def _make_recipe(self):
+        return dedent(f'''
             Mesh(
-                vertices={[tuple(e) for e in self.vertices]},
-                triangles={self._triangles},
-                colors={[tuple(e) for e in self.colors]},
-                uvs={self.uvs},
-                normals={[tuple(e) for e in self.normals]},
+                vertices={_as_rows(self.vertices, 3)},
+                triangles={self._triangles.tolist() if _is_array(self._triangles) else self._triangles},
+                colors={_as_rows(self.colors, 4)},
+                uvs={_as_rows(self.uvs, 2) if _is_array(self.uvs) else self.uvs},
+                normals={_as_rows(self.normals, 3)},
                 static={self.static},
                 mode="{self.mode}",
                 thickness={self.thickness}
             )
         ''')
-        # print('finished')
+
+
+    # change part of the mesh in place, without generate(), for things like animating vertices or painting colors.
+    # only the rows from start to start+len(data) get written, and the triangles are kept as they are.
+    # data can be a list or a numpy array with one row per vertex. works best with static=False.
+    def update_vertices(self, start, data):
+        self._update_column('vertices', 'vertex', start, data, 3, swap_yz=True)
+
+    def update_colors(self, start, data):
+        self._update_column('colors', 'color', start, data, 4)
+
+    def update_uvs(self, start, data):
+        self._update_column('uvs', 'texcoord', start, data, 2)
+
+
+    def _update_column(self, name, column, start, data, width, swap_yz=False):
+        if _is_array(data):
+            import numpy
+            data = numpy.asarray(data, dtype=numpy.float32).reshape(-1, width)
+        end = start + len(data)
+        self._recipe = None
+
+        # keep self.vertices, self.colors and self.uvs the same as what's in the buffer, so generate() gives the same result.
+        # updates past the end grow the mesh, but they have to start inside it or right after it.
+        values = getattr(self, name)
+        if _is_array(values):
+            import numpy
+            # a contiguous float32 copy if it isn't one already, since reshape() would copy it and the write would get lost
+            values = numpy.ascontiguousarray(values, dtype=numpy.float32).reshape(-1, width)
+        elif not isinstance(values, list):
+            values = list(values) if values is not None else list()
+
+        if start < 0 or start > len(values):
+            raise IndexError(f'can\'t update {name} from {start}, the mesh has {len(values)}')
+
+        if _is_array(values):
+            if end > len(values):
+                grown = numpy.zeros((end, width), dtype=numpy.float32)
+                grown[:len(values)] = values
+                values = grown
+            values[start:end] = data
+        else:
+            values[start:end] = [tuple(e) for e in data.tolist()] if _is_array(data) else data
+        setattr(self, name, values)
+
+        if not self.vdata or not self.vdata.hasColumn(column) or end > self.vdata.getNumRows():
+            self.generate()     # the column or rows don't exist yet, so it has to be built again
+            return
+
+        if self.static:
+            self.static = False
+            self.vdata.setUsageHint(Geom.UHDynamic)
+
+        if _is_array(data):
+            rows = numpy.frombuffer(memoryview(self.vdata.modifyArray(0)), dtype=_rows_dtype(self.vdata))
+            if swap_yz:
+                data = data[:, (0,2,1)]
+            if rows.dtype[column].base == numpy.uint8:
+                data = numpy.clip(data * 255, 0, 255)
+            rows[column][start:end] = data
+            return
+
+        writer = GeomVertexWriter(self.vdata, column)
+        writer.setRow(start)
+        set_data = getattr(writer, f'setData{width}f')
+        for e in data:
+            if swap_yz:
+                set_data(e[0], e[2], e[1])
+            else:
+                set_data(*e)
+
 
     def __add__(self, other):
         self.vertices += other.vertices
         self.triangles += other.triangles
-        if other.colors:
+        if _has_data(other.colors):
             self.colors += other.colors
         else:
             self.colors += (color.white, ) * len(other.vertices)
@@ -189,7 +356,7 @@ class Mesh(NodePath):
 
     @property
     def triangles(self):
-        if self._triangles == None:
+        if self._triangles is None:
             self._triangles = [(i, i+1, i+2) for i in range(0, len(self.vertices), 3)]
 
         return self._triangles
@@ -199,8 +366,29 @@ class Mesh(NodePath):
         self._triangles = value
 
 
+    def _flat_triangle_array(self):
+        # the triangles as one flat numpy array of indices. rows of 4 are quads, rows of 5 or more are polygons, which get split into a fan of tris.
+        import numpy
+        triangles = numpy.asarray(self.triangles, dtype=numpy.uint32)
+        if triangles.ndim == 2 and self.mode == 'triangle' and triangles.shape[1] != 3:
+            width = triangles.shape[1]
+            if width == 4:    # turn quads into tris
+                triangles = triangles[:, (0,1,2,2,3,0)]
+            elif width > 4:
+                triangles = triangles[:, [e for i in range(1, width-1) for e in (0, i, i+1)]]
+            else:
+                raise ValueError(f'triangles need at least 3 indices per row, got an array of shape {triangles.shape}')
+        return numpy.ascontiguousarray(triangles.ravel())
+
+
     def generate_normals(self, smooth=True, inverse=True):
-        self.normals = list(generate_normals(self.vertices, self.triangles, smooth, inverse))
+        vertices, triangles = self.vertices, self.triangles
+        # generate_normals() works on lists of rows
+        if _is_array(vertices):
+            vertices = _as_rows(vertices, 3)
+        if _is_array(triangles):
+            triangles = self._flat_triangle_array().reshape(-1, 3).tolist() if len(triangles) else None
+        self.normals = list(generate_normals(vertices, triangles, smooth, inverse))
         self.generate()
         return self.normals
 
@@ -232,6 +420,10 @@ class Mesh(NodePath):
             from ursina.mesh_importer import ursina_mesh_to_obj
             ursina_mesh_to_obj(self, name, path)
 
+        elif filetype == 'npz':     # binary, loads much faster than .ursinamesh. needs numpy.
+            from ursina.mesh_importer import ursina_mesh_to_npz
+            ursina_mesh_to_npz(self, name, path)
+
 
 
 
@@ -257,5 +449,8 @@ if __name__ == '__main__':
     # points.model.mode = MeshModes.point     # can also use  the MeshMode enum
     print(e.model.recipe)
 
+    def update():   # move one point without calling generate()
+        points.model.update_vertices(2, [Vec3(1, 1 + math.sin(time.time()), 0)])
+
     EditorCamera()
     app.run()
@@ -7,12 +7,31 @@ from ursina import application
 
 
 def load_model(name, path=application.asset_folder):
-    for filetype in ('.bam', '.ursinamesh', '.obj', '.blend'):
-        # warning: glob is case-insensitive on windows, so m.path will be all lowercase
-        for filename in path.glob(f'**/{name}{filetype}'):
+    # search the folder once for all the file types, then try them in this order
+    filetypes = ('.bam', '.npz', '.ursinamesh', '.obj', '.blend')
+    found = {filetype : list() for filetype in filetypes}
+    # warning: glob is case-insensitive on windows, so m.path will be all lowercase
+    for filename in path.glob(f'**/{name}.*'):
+        filetype = filename.suffix.lower()
+        if filetype in found and len(filename.stem) == len(Path(name).name):   # not a name with more dots, like name.old.obj
+            found[filetype].append(filename)
+
+    for filetype in filetypes:
+        for filename in found[filetype]:
             if filetype == '.bam':
                 return loader.loadModel(filename)
 
+            if filetype == '.npz':
+                try:
+                    m = load_npz(filename)
+                    m.path = filename
+                    m.name = name
+                    return m
+                except ImportError:     # needs numpy
+                    pass
+                except Exception as e:
+                    print('invalid npz mesh file:', filename, e)
+
             if filetype == '.ursinamesh':
                 try:
                     with open(filename) as f:
@@ -76,7 +95,70 @@ if not hasattr(application, 'blender_paths'):
 
 
 
-def compress_models(path=application.models_folder, outpath=application.compressed_models_folder, name='*'):
+# binary mesh file. it's an uncompressed numpy .npz, so loading it is just copying the arrays, nothing gets parsed or evaluated.
+# holds float32 vertices, colors, uvs and normals, uint32 triangles, and the mode, static and thickness.
+# triangles with different lengths, like line segments, are saved flat with triangle_sizes to split them again.
+npz_version = 1
+
+def ursina_mesh_to_npz(mesh, name='', out_path=application.models_folder):
+    import numpy
+    from ursina.string_utilities import camel_to_snake
+    from ursina.mesh import _has_data
+
+    if not name:
+        name = camel_to_snake(mesh.__class__.__name__)
+    if not name.endswith('.npz'):
+        name += '.npz'
+
+    arrays = dict(version=numpy.array(npz_version), mode=numpy.array(str(getattr(mesh.mode, 'value', mesh.mode))), static=numpy.array(bool(mesh.static)), thickness=numpy.array(float(mesh.thickness)))
+    arrays['vertices'] = numpy.asarray(mesh.vertices, dtype=numpy.float32).reshape(-1, 3)
+    for attribute, width in (('colors', 4), ('uvs', 2), ('normals', 3)):
+        if _has_data(getattr(mesh, attribute)):
+            arrays[attribute] = numpy.asarray(getattr(mesh, attribute), dtype=numpy.float32).reshape(-1, width)
+
+    triangles = mesh.triangles
+    if _has_data(triangles):
+        if isinstance(triangles, (list, tuple)) and not isinstance(triangles[0], int) and len(set(len(t) for t in triangles)) > 1:
+            arrays['triangle_sizes'] = numpy.array([len(t) for t in triangles], dtype=numpy.uint32)
+            triangles = [i for t in triangles for i in t]
+        arrays['triangles'] = numpy.asarray(triangles, dtype=numpy.uint32)
+
+    with open(out_path / name, 'wb') as f:
+        numpy.savez(f, **arrays)
+    print('saved npz mesh:', out_path / name)
+
+
+def load_npz(filename):
+    import numpy
+    with numpy.load(filename, allow_pickle=False) as data:
+        if int(data['version']) > npz_version:
+            raise ValueError(f'npz mesh version {int(data["version"])} is newer than this version of ursina supports ({npz_version})')
+
+        arrays = {attribute : data[attribute] for attribute in ('vertices', 'colors', 'uvs', 'normals', 'triangles') if attribute in data}
+        if 'triangle_sizes' in data:
+            flat, triangles, i = arrays['triangles'].tolist(), list(), 0
+            for size in data['triangle_sizes'].tolist():
+                triangles.append(tuple(flat[i:i+size]))
+                i += size
+            arrays['triangles'] = triangles
+
+        m = Mesh(**arrays, mode=str(data['mode']), static=bool(data['static']), thickness=float(data['thickness']))
+
+    # the vertex buffer is made from the arrays in one go, but keep lists on the Mesh like the other formats,
+    # since code like colliders and combine() expects lists of tuples
+    for attribute in ('vertices', 'colors', 'uvs', 'normals', 'triangles'):
+        values = getattr(m, attribute)
+        if isinstance(values, list):
+            continue
+        if values.ndim == 2:
+            setattr(m, attribute, list(zip(*values.T.tolist())))   # a list per column zipped into tuples, a lot faster than a tuple per row
+        else:
+            setattr(m, attribute, values.tolist())
+    return m
+
+
+def compress_models(path=application.models_folder, outpath=application.compressed_models_folder, name='*', filetype=None):
+    # filetype can be 'ursinamesh' or 'npz' to convert the exported .obj files too
 
     if not application.compressed_models_folder.exists():
         application.compressed_models_folder.mkdir()
@@ -97,6 +179,9 @@ def compress_models(path=application.models_folder, outpath=application.compress
         print('converting .blend file to .obj:', outfile, 'using:', blender)
         subprocess.call(f'''{blender} {outfile} --background --python {export_script_path}''')
         exported.append(f)
+        if filetype:
+            obj_folder = Path(f).parent / 'compressed'
+            obj_to_ursinamesh(path=obj_folder, outpath=obj_folder, name=Path(f).stem, filetype=filetype)
 
     return exported
 
@@ -106,7 +191,8 @@ def obj_to_ursinamesh(
     outpath=application.compressed_models_folder,
     name='*',
     save_to_file=True,
-    delete_obj=True
+    delete_obj=True,
+    filetype='ursinamesh',  # or 'npz'
     ):
 
     for f in path.glob(f'**/{name}.obj'):
@@ -183,6 +269,16 @@ def obj_to_ursinamesh(
                 except: # if no normals
                     pass
 
+        if filetype == 'npz' and save_to_file:
+            outfilepath = outpath / (os.path.splitext(f)[0] + '.npz')
+            m = Mesh(vertices=[verts[t] for t in tris], mode='triangle',
+                uvs=[uvs[uid] for uid in uv_indices] if uv_indices else None,
+                normals=[norms[nid] for nid in norm_indices] if norm_indices else None)
+            ursina_mesh_to_npz(m, outfilepath.name, outfilepath.parent)
+            if delete_obj:
+                os.remove(filepath)
+            continue
+
         meshstring += '\nvertices='
         meshstring += str(tuple([verts[t] for t in tris]))
 
@@ -26,6 +26,7 @@ class Mouse():
         self.double_click_distance = .5
 
         self.hovered_entity = None
+        self._hovered_entities = list()     # entities the mouse has set hovered on, so unhovering doesn't have to check every entity
         self.left = False
         self.right = False
         self.middle = False
@@ -77,6 +78,8 @@ class Mouse():
 
     @position.setter
     def position(self, value):
+        if application.headless:
+            return
         base.win.move_pointer(
             0,
             int(value[0] + (window.size[0]/2) + (value[0]/2*window.size[0]) *1.123), # no idea why I have * with 1.123
@@ -89,13 +92,15 @@ class Mouse():
 
         if name == 'visible':
             window.set_cursor_hidden(not value)
-            application.base.win.requestProperties(window)
+            if not application.headless:
+                application.base.win.requestProperties(window)
 
         if name == 'locked':
             try:
                 object.__setattr__(self, name, value)
                 window.set_cursor_hidden(value)
-                application.base.win.requestProperties(window)
+                if not application.headless:
+                    application.base.win.requestProperties(window)
             except:
                 pass
 
@@ -206,8 +211,8 @@ class Mouse():
         else:
             # print('mouse miss', base.render)
             # unhover all if it didn't hit anything
-            for entity in scene.entities:
-                if hasattr(entity, 'hovered') and entity.hovered:
+            for entity in self._hovered_entities:
+                if entity in scene.entities and entity.hovered:
                     entity.hovered = False
                     self.hovered_entity = None
                     if hasattr(entity, 'on_mouse_exit'):
@@ -215,6 +220,13 @@ class Mouse():
                     for s in entity.scripts:
                         if hasattr(s, 'on_mouse_exit'):
                             s.on_mouse_exit()
+            self._hovered_entities.clear()
+
+    @property
+    def hovered_instance(self):     # the InstancedEntity under the mouse, if hovered_entity is an Instancer
+        if self.collision:
+            return self.collision.instance
+        return None
 
     @property
     def normal(self):
@@ -250,30 +262,31 @@ class Mouse():
         self._pq.sortEntries()
 
         for entry in self._pq.getEntries():
-            for entity in scene.entities:
-                if entry.getIntoNodePath().parent == entity and entity.collision:
-                    if entity.collision:
-                        hit = Hit(
-                            hit = entry.collided(),
-                            entity = entity,
-                            distance = 0,
-                            point = entry.getSurfacePoint(entity),
-                            world_point = entry.getSurfacePoint(scene),
-                            normal = entry.getSurfaceNormal(entity),
-                            world_normal = entry.getSurfaceNormal(scene),
-                            )
-                        hit.point = Vec3(hit.point[0], hit.point[2], hit.point[1])
-                        hit.world_point = Vec3(hit.world_point[0], hit.world_point[2], hit.world_point[1])
-                        hit.normal = Vec3(hit.normal[0], hit.normal[2], hit.normal[1])
-                        hit.world_normal = Vec3(hit.world_normal[0], hit.world_normal[2], hit.world_normal[1])
-                        self.collisions.append(hit)
-                        break
+            entity = scene.entities.entity_of(entry.getIntoNodePath().parent)
+            if entity is not None and entity.collision:
+                hit = Hit(
+                    hit = entry.collided(),
+                    entity = entity,
+                    instance = entry.getIntoNodePath().get_python_tag('instance'),
+                    distance = 0,
+                    point = entry.getSurfacePoint(entity),
+                    world_point = entry.getSurfacePoint(scene),
+                    normal = entry.getSurfaceNormal(entity),
+                    world_normal = entry.getSurfaceNormal(scene),
+                    )
+                hit.point = Vec3(hit.point[0], hit.point[2], hit.point[1])
+                hit.world_point = Vec3(hit.world_point[0], hit.world_point[2], hit.world_point[1])
+                hit.normal = Vec3(hit.normal[0], hit.normal[2], hit.normal[1])
+                hit.world_normal = Vec3(hit.world_normal[0], hit.world_normal[2], hit.world_normal[1])
+                self.collisions.append(hit)
 
         if self.collisions:
             self.collision = self.collisions[0]
             self.hovered_entity = self.collision.entity
             if not self.hovered_entity.hovered:
                 self.hovered_entity.hovered = True
+                if self.hovered_entity not in self._hovered_entities:
+                    self._hovered_entities.append(self.hovered_entity)
                 if hasattr(self.hovered_entity, 'on_mouse_enter'):
                     self.hovered_entity.on_mouse_enter()
                 for s in self.hovered_entity.scripts:
@@ -286,11 +299,13 @@ class Mouse():
 
 
     def unhover_everything_not_hit(self):
-        for e in scene.entities:
+        still_hovered = list()
+        for e in self._hovered_entities:
             if e == self.hovered_entity:
+                still_hovered.append(e)
                 continue
 
-            if e.hovered:
+            if e in scene.entities and e.hovered:
                 e.hovered = False
                 if hasattr(e, 'on_mouse_exit'):
                     e.on_mouse_exit()
@@ -298,6 +313,8 @@ class Mouse():
                     if hasattr(s, 'on_mouse_exit'):
                         s.on_mouse_exit()
 
+        self._hovered_entities = still_hovered
+
 
 
 sys.modules[__name__] = Mouse()
@@ -42,7 +42,7 @@ class DropdownMenu(DropdownMenuButton):
 
     def open(self):
         for i, b in enumerate(self.buttons):
-            invoke(setattr, self.buttons[i], 'enabled', True, delay=(i*.02))
+            invoke(setattr, self.buttons[i], 'enabled', True, delay=(i*.02), ignore_paused=True)
 
     def close(self):
         for i, b in enumerate(reversed(self.buttons)):
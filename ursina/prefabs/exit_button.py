@@ -16,7 +16,7 @@ class ExitButton(Button):
 
 
     def on_click(self):
-        invoke(application.quit, delay=.01)
+        invoke(application.quit, delay=.01, ignore_paused=True)
         
 
     def input(self, key):
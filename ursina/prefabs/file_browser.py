@@ -166,13 +166,13 @@ class FileBrowser(Entity):
     def on_enable(self):
         if not hasattr(self, 'path'):
             self.path = self.start_path
-            invoke(setattr, self, 'scroll', 0, delay=.05)
+            invoke(setattr, self, 'scroll', 0, delay=.05, ignore_paused=True)
             return
 
         self.scale = 1
         self.path = self.path
         self.button_parent.y = 0
-        invoke(setattr, self, 'scroll', 0, delay=.1)
+        invoke(setattr, self, 'scroll', 0, delay=.1, ignore_paused=True)
 
 
     def close(self):
@@ -36,14 +36,8 @@ class FirstPersonController(Entity):
         camera.rotation_x -= mouse.velocity[1] * 40
         camera.rotation_x = clamp(camera.rotation_x, -90, 90)
 
-        self.y += held_keys['e']
-        self.y -= held_keys['q']
-
-        self.direction = Vec3(
-            self.forward * (held_keys['w'] - held_keys['s'])
-            + self.right * (held_keys['d'] - held_keys['a'])
-            ).normalized()
-
+        if not application.fixed_timestep:
+            self.fixed_update()
 
         self.smoothing = lerp(self.smoothing, self.target_smoothing, 4*time.dt)
         camera.position = lerp(
@@ -53,6 +47,16 @@ class FirstPersonController(Entity):
 
         camera.rotation_y = self.rotation_y
 
+
+    def fixed_update(self):     # runs at a fixed rate when application.fixed_timestep is set, otherwise every frame
+        self.y += held_keys['e']
+        self.y -= held_keys['q']
+
+        self.direction = Vec3(
+            self.forward * (held_keys['w'] - held_keys['s'])
+            + self.right * (held_keys['d'] - held_keys['a'])
+            ).normalized()
+
         origin = self.world_position + self.up + (self.direction/2)
         middle_ray = raycast(origin , self.direction, ignore=[self,], distance=1.3, debug=False)
         left_ray =   raycast(origin, lerp(self.left, self.forward, .5), ignore=[self,], distance=1.4, debug=False)
@@ -0,0 +1,149 @@
+from ursina import *
+from collections import defaultdict, deque
+import json
+from types import ModuleType
+from ursina.tween import Tween
+
+
+def _name_of(f):    # functools.partial and callable objects don't have a __name__
+    return getattr(f, '__name__', type(f).__name__)
+
+
+class FrameProfiler(Entity):
+    def __init__(self, **kwargs):
+        super().__init__()
+        self.name = 'frame_profiler'
+        self.eternal = True
+        self.ignore_paused = True
+        self.history_length = 300   # number of frames to calculate percentiles from
+        self.max_lines = 12
+        self.trace_threshold = .0001    # calls taking longer than this (in seconds) get their own event in the trace
+        self.max_trace_events = 100000
+        self.toggle_key = 'f3'
+
+        self.history = defaultdict(lambda: deque(maxlen=self.history_length))   # (category, label) : per frame totals
+        self.trace_events = deque(maxlen=self.max_trace_events)
+        self._frame_totals = defaultdict(float)
+        self._frame_start = None
+
+        self.update_rate = 2    # refresh the overlay twice per second
+
+        self.overlay = Text(parent=camera.ui, position=window.top_left + Vec2(.01, -.03), scale=.75, eternal=True, enabled=False)
+
+        application.profiler = self     # before the kwargs, so enabled=False can take it off again
+        for key, value in kwargs.items():
+            setattr(self, key, value)
+
+
+    def on_enable(self):
+        application.profiler = self
+
+    def on_disable(self):
+        application.profiler = None
+        self._frame_start = None
+
+
+    def input(self, key):
+        if key == self.toggle_key:
+            self.overlay.enabled = not self.overlay.enabled
+
+
+    def update(self):
+        if self.overlay.enabled:
+            self.overlay.text = self.report()
+            self.overlay.create_background()
+
+
+    def new_frame(self):    # called by Ursina._update. closes the previous frame and starts a new one.
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            self._frame_totals[('frame', 'total')] = now - self._frame_start
+            self._add_trace_event('frame', self._frame_start, now - self._frame_start)
+
+            for key in set(self.history) | set(self._frame_totals):
+                self.history[key].append(self._frame_totals.get(key, 0))
+
+        self._frame_totals = defaultdict(float)
+        self._frame_start = now
+
+
+    def call(self, category, owner, function, *args):
+        t = time.perf_counter()
+        function(*args)
+        duration = time.perf_counter() - t
+
+        if isinstance(owner, Tween):
+            label = f'Tween({owner.name})'
+        elif isinstance(owner, Sequence):
+            label = 'Sequence(' + (_name_of(getattr(owner.funcs[0], 'func', owner.funcs[0])) if owner.funcs else '') + ')'
+        elif isinstance(owner, ModuleType):    # __main__
+            label = _name_of(owner)
+        else:
+            label = owner.__class__.__name__
+
+        self._frame_totals[(category, label)] += duration
+        if duration >= self.trace_threshold:
+            self._add_trace_event(f'{category} {label}', t, duration, getattr(owner, 'name', None))
+
+
+    def _add_trace_event(self, name, start, duration, owner_name=None):
+        event = {'name' : name, 'cat' : name.split(' ')[0], 'ph' : 'X', 'pid' : 0, 'tid' : 0,
+            'ts' : start * 1000000, 'dur' : duration * 1000000}
+        if owner_name:
+            event['args'] = {'name' : owner_name}
+        self.trace_events.append(event)
+
+
+    def percentiles(self, key, percentiles=(50, 95, 99)):
+        values = sorted(self.history[key])
+        if not values:
+            return [0 for p in percentiles]
+        return [values[min(int(len(values) * p / 100), len(values)-1)] for p in percentiles]
+
+
+    def report(self):
+        # slowest things first, in milliseconds
+        rows = sorted([(self.percentiles(key), key) for key in self.history], reverse=True)
+        text = 'p50 / p95 / p99 ms\n'
+        for (p50, p95, p99), (category, label) in rows[:self.max_lines]:
+            text += f'{p50*1000:.2f} / {p95*1000:.2f} / {p99*1000:.2f}  {category} {label}\n'
+        return text
+
+
+    def save_trace(self, path=None):
+        # open in chrome://tracing or https://ui.perfetto.dev
+        if path is None:
+            path = application.asset_folder / 'trace.json'
+
+        with open(path, 'w') as f:
+            json.dump({'traceEvents' : list(self.trace_events), 'displayTimeUnit' : 'ms'}, f)
+
+        print('saved trace:', path)
+        return path
+
+
+    def clear(self):
+        self.history.clear()
+        self.trace_events.clear()
+
+
+
+if __name__ == '__main__':
+    app = Ursina()
+    profiler = FrameProfiler()
+    profiler.overlay.enabled = True
+
+    class Spinner(Entity):
+        def update(self):
+            self.rotation_y += 100 * time.dt
+
+    for i in range(100):
+        Spinner(model='cube', x=(i%10)-5, y=(i//10)-5, scale=.5)
+
+    def input(key):
+        if key == 's':
+            profiler.save_trace()
+        if key == 'p':
+            profiler.enabled = not profiler.enabled
+
+    app.run()
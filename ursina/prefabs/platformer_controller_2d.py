@@ -46,6 +46,11 @@ class PlatformerController2d(Entity):
 
 
     def update(self):
+        if not application.fixed_timestep:
+            self.fixed_update()
+
+
+    def fixed_update(self):     # runs at a fixed rate when application.fixed_timestep is set, otherwise every frame
         if raycast(self.position+Vec3(0,.05,0), self.right, .5, ignore=(self, ), debug=True).hit == False:
             self.x += self.velocity * time.dt * self.walk_speed
 
@@ -55,9 +55,9 @@ class RadialMenu(Entity):
 
     def input(self, key):
         if key == 'left mouse down' and mouse.hovered_entity in [c for c in self.children if isinstance(c, Button)]:
-            invoke(setattr, self, 'enabled', False, delay=.1)
+            invoke(setattr, self, 'enabled', False, delay=.1, ignore_paused=True)
         elif key == 'left mouse down' and mouse.hovered_entity == self.bg:
-            invoke(setattr, self, 'enabled', False, delay=.1)
+            invoke(setattr, self, 'enabled', False, delay=.1, ignore_paused=True)
 
 
 class RadialMenuButton(Button):
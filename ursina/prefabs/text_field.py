@@ -59,7 +59,7 @@ class TextField(Entity):
                 self.cursor.color = color.clear
             else:
                 self.cursor.color = color.azure
-            invoke(blink_cursor, delay=.5)
+            invoke(blink_cursor, delay=.5, ignore_paused=True)
 
         blink_cursor()
         self.text = ''
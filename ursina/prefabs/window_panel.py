@@ -86,7 +86,7 @@ class WindowPanel(Draggable):
             def close():
                 self.bg.enabled = False
                 self.animate_scale_y(0, duration=.1)
-                invoke(setattr, self, 'enabled', False, delay=.2)
+                invoke(setattr, self, 'enabled', False, delay=.2, ignore_paused=True)
 
                 if hasattr(self, 'close'):
                     self.close()
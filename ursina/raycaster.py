@@ -57,12 +57,11 @@ class Raycaster(Entity):
             self.hit = Hit(hit=False)
             return self.hit
 
-        ignore += tuple([e for e in scene.entities if not e.collision])
-
         self._pq.sort_entries()
-        self.entries = [        # filter out ignored entities
+        self.entries = [        # filter out ignored entities and entities with collision turned off
             e for e in self._pq.getEntries()
             if e.get_into_node_path().parent not in ignore
+            and getattr(scene.entities.entity_of(e.get_into_node_path().parent), 'collision', True)
             ]
 
         if len(self.entries) == 0:
@@ -81,10 +80,10 @@ class Raycaster(Entity):
             nP = nP.parent
 
         self.hit = Hit(hit=True)
-        for e in scene.entities:
-            if e == nP:
-                # print('cast nP to Entity')
-                self.hit.entity = e
+        entity = scene.entities.entity_of(nP)
+        if entity is not None:
+            self.hit.entity = entity
+            self.hit.instance = self.collision.get_into_node_path().get_python_tag('instance')
 
         self.hit.point = point
         self.hit.world_point = world_point
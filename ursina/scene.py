@@ -3,6 +3,7 @@ from panda3d.core import NodePath
 from panda3d.core import Fog
 from ursina import color
 from ursina.texture_importer import load_texture
+from ursina.entity_registry import EntityRegistry
 # from ursina.ursinastuff import destroy
 # from ursina.entity import Entity
 
@@ -19,7 +20,12 @@ class Scene(NodePath):
         self.canvas = None
         self.ui = None
 
-        self.entities = []
+        self.entities = EntityRegistry()
+        self.update_registry = dict()   # entity : (has_update, scripts_with_update). maintained by Entity, read by Ursina._update
+        self.update_rate_registry = dict()  # update_rate : {entity : (has_update, scripts_with_update)}, for entities that don't update every frame
+        self.fixed_update_registry = dict() # same as update_registry, but for fixed_update, used when application.fixed_timestep is set
+        self.input_registry = dict()    # entity : things with an input function that want every key
+        self.input_key_registry = dict()    # key : {entity : things with an input function that only want that key}
         self.hidden = NodePath('hidden')
         self.reflection_map = 'reflection_map_3'
 
@@ -38,7 +44,6 @@ class Scene(NodePath):
     def clear(self):
         from ursina.ursinastuff import destroy
         to_destroy = [e for e in self.entities if not e.eternal]
-        to_keep = [e for e in self.entities if e.eternal]
 
         for d in to_destroy:
             try:
@@ -46,12 +51,60 @@ class Scene(NodePath):
                 destroy(d)
             except Exception as e:
                 print('failed to destroy entity', e)
+                self.entities.discard(d)
 
 
-        self.entities = to_keep
-
-        from ursina import application
+        from ursina import application, timers, coroutines
         application.sequences.clear()
+        timers.clear()
+        coroutines.clear()
+
+
+    # find entities by name, type and/or tag, like scene.find_all(type=Button) or scene.find(name='player').
+    # a path without a keyword goes to panda3d's NodePath.find(), like scene.find('**/+GeomNode').
+    def find(self, *args, name=None, type=None, tag=None):
+        if args:
+            return super().find(*args)
+        return self.entities.find(name=name, type=type, tag=tag)
+
+    def find_all(self, name=None, type=None, tag=None):
+        return self.entities.find_all(name=name, type=type, tag=tag)
+
+
+    # bulk versions of entity.position, entity.rotation and entity.scale, for simulations written with numpy.
+    # positions, rotations and scales are (N,3) arrays in the same order as entities, in ursina's axes (y up).
+    def set_transforms(self, entities, positions=None, rotations=None, scales=None):
+        import numpy
+        if positions is not None:
+            positions = numpy.asarray(positions, dtype=float)[:, (0,2,1)].tolist()
+            for e, pos in zip(entities, positions):
+                e.setPos(*pos)
+
+        if rotations is not None:
+            hpr = numpy.asarray(rotations, dtype=float)[:, (1,0,2)] * (-1,-1,1)
+            for e, rot in zip(entities, hpr.tolist()):
+                e.setHpr(*rot)
+
+        if scales is not None:
+            scales = numpy.asarray(scales, dtype=float)[:, (0,2,1)]
+            scales[scales == 0] = .001
+            for e, scale in zip(entities, scales.tolist()):
+                e.setScale(*scale)
+
+
+    def get_positions(self, entities):
+        return self._get_vectors(entities, NodePath.getPos)[:, (0,2,1)]
+
+    def get_rotations(self, entities):
+        return self._get_vectors(entities, NodePath.getHpr)[:, (1,0,2)] * (-1,-1,1)
+
+    def get_scales(self, entities):
+        return self._get_vectors(entities, NodePath.getScale)[:, (0,2,1)]
+
+    def _get_vectors(self, entities, getter):
+        import numpy
+        from itertools import chain
+        return numpy.fromiter(chain.from_iterable(map(getter, entities)), dtype=numpy.float32, count=len(entities)*3).reshape(-1,3)
 
 
     @property
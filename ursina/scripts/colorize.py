@@ -16,7 +16,7 @@ def get_world_normals(model):
 
 def colorize(model, left=color.white, right=color.blue, down=color.red, up=color.green, back=color.white, forward=color.white, smooth=True, world_space=True):
 
-    if not model.normals:
+    if model.normals is None or not len(model.normals):
         print('generating normals for', model)
         model.generate_normals(smooth=smooth)
 
@@ -32,7 +32,8 @@ class Sequence():
         self.t = 0
         self.time_step = Sequence.default_time_step
         self.duration = 0
-        self.funcs = list()
+        self.funcs = list()     # sorted by delay
+        self._cursor = 0        # index of the next func to run
         self.paused = True
         self.loop = False
         self.auto_destroy = True
@@ -47,6 +48,7 @@ class Sequence():
 
     def generate(self):
         self.funcs = list()
+        self._cursor = 0
 
         for arg in self.args:
             if isinstance(arg, Wait):
@@ -69,13 +71,20 @@ class Sequence():
 
         elif isinstance(arg, Func):
             arg.delay = self.duration
-            self.funcs.append(arg)
+            # duration only grows, so this is usually the end. insert in order in case delays were changed by hand.
+            i = len(self.funcs)
+            while i > 0 and self.funcs[i-1].delay > arg.delay:
+                i -= 1
+            self.funcs.insert(i, arg)
+            if i < self._cursor:
+                self._cursor += 1
 
 
     def start(self):
         for f in self.funcs:
             f.finished = False
 
+        self._cursor = 0
         self.t = 0
         self.paused = False
 
@@ -104,8 +113,11 @@ class Sequence():
         else:
             self.t += self.time_step * application.time_scale
 
-        for f in self.funcs:
-            if not f.finished and f.delay <= self.t:
+        # run the funcs that are due, in order. after a long frame that can be many of them.
+        while self._cursor < len(self.funcs) and self.funcs[self._cursor].delay <= self.t:
+            f = self.funcs[self._cursor]
+            self._cursor += 1
+            if not f.finished:
                 f.run()
 
 
@@ -114,6 +126,7 @@ class Sequence():
                 for f in self.funcs:
                     f.finished = False
 
+                self._cursor = 0
                 self.t = 0
                 return
 
@@ -1,4 +1,5 @@
 from ursina.shaders.normals import normals_shader
+from ursina.shaders.instancing import instancing_shader
 
 
 
@@ -0,0 +1,42 @@
+from panda3d.core import Shader
+
+
+# used by Instancer. instance_data is a buffer texture with 4 texels per instance:
+# the first three rows of the instance's transform, with the position in w, and then its color.
+instancing_shader = Shader.make(Shader.SL_GLSL,
+vertex='''
+#version 140
+uniform mat4 p3d_ModelViewProjectionMatrix;
+uniform samplerBuffer instance_data;
+in vec4 p3d_Vertex;
+in vec4 p3d_Color;
+in vec2 p3d_MultiTexCoord0;
+out vec2 texcoord;
+out vec4 vertex_color;
+
+void main() {
+    int i = gl_InstanceID * 4;
+    vec4 x = texelFetch(instance_data, i);
+    vec4 y = texelFetch(instance_data, i + 1);
+    vec4 z = texelFetch(instance_data, i + 2);
+    vec3 v = p3d_Vertex.xyz;
+    vec4 position = vec4(dot(x.xyz, v) + x.w, dot(y.xyz, v) + y.w, dot(z.xyz, v) + z.w, 1);
+
+    gl_Position = p3d_ModelViewProjectionMatrix * position;
+    texcoord = p3d_MultiTexCoord0;
+    vertex_color = p3d_Color * texelFetch(instance_data, i + 3);
+}
+''',
+
+fragment='''
+#version 140
+uniform sampler2D p3d_Texture0;
+uniform vec4 p3d_ColorScale;
+in vec2 texcoord;
+in vec4 vertex_color;
+out vec4 fragColor;
+
+void main() {
+    fragColor = texture(p3d_Texture0, texcoord) * p3d_ColorScale * vertex_color;
+}
+''', geometry='')
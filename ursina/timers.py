@@ -0,0 +1,83 @@
+import heapq
+import itertools
+from ursina import application
+
+
+# one heap for every delayed call made with invoke(delay=...) and destroy(delay=...).
+# update() only looks at the first timer, so waiting timers cost nothing per frame.
+# follows game time: stops while application.paused and speeds up and slows down with application.time_scale.
+# timers made with ignore_paused=True keep going while paused, for things like menus.
+elapsed = 0     # game time in seconds
+elapsed_ignoring_pause = 0  # same, but keeps counting while paused
+_timers = list()    # heap of (time, i, Timer)
+_ignore_paused_timers = list()
+_counter = itertools.count()
+
+
+class Timer():
+    def __init__(self, time, function, args, kwargs, ignore_paused=False):
+        self.time = time
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.ignore_paused = ignore_paused
+        self.cancelled = False
+        self.finished = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    kill = cancel   # invoke() used to return a Sequence, so keep its name for this too
+
+    @property
+    def time_left(self):
+        return max(self.time - (elapsed_ignoring_pause if self.ignore_paused else elapsed), 0)
+
+
+def call_later(delay, function, *args, ignore_paused=False, **kwargs):  # returns a Timer, which can be cancelled with .cancel()
+    if ignore_paused:
+        timer = Timer(elapsed_ignoring_pause + delay, function, args, kwargs, ignore_paused=True)
+        heapq.heappush(_ignore_paused_timers, (timer.time, next(_counter), timer))
+    else:
+        timer = Timer(elapsed + delay, function, args, kwargs)
+        heapq.heappush(_timers, (timer.time, next(_counter), timer))
+    return timer
+
+
+def update(dt):     # called by Ursina._update with time.dt, which already has time_scale applied
+    global elapsed, elapsed_ignoring_pause
+    elapsed_ignoring_pause += dt
+    _call_due(_ignore_paused_timers, elapsed_ignoring_pause)
+    if application.paused:
+        return
+
+    elapsed += dt
+    _call_due(_timers, elapsed)
+
+
+def _call_due(timers, now):
+    while timers and timers[0][0] <= now:
+        timer = heapq.heappop(timers)[2]
+        if not timer.cancelled:
+            timer.finished = True
+            timer.function(*timer.args, **timer.kwargs)
+
+
+def clear():
+    for timers in (_timers, _ignore_paused_timers):
+        for time, i, timer in timers:
+            timer.cancel()
+        timers.clear()
+
+
+
+if __name__ == '__main__':
+    from ursina import *
+    app = Ursina()
+    e = Entity(model='cube')
+
+    invoke(print, 'after one second', delay=1)
+    timer = invoke(print, 'this never gets printed', delay=2)
+    invoke(timer.cancel, delay=1.5)
+    destroy(e, delay=3)
+    app.run()
@@ -0,0 +1,63 @@
+import time
+from panda3d.core import LVecBase2f, LVecBase3f, LVecBase4f
+from ursina import application
+from ursina.sequence import Sequence
+from ursina.ursinamath import lerp
+from ursina import curve
+
+
+# animates one attribute from its current value to value, by evaluating the curve at the current time every frame.
+# used by Entity.animate(). it's a Sequence, so it can be paused, resumed, finished and killed the same way.
+class Tween(Sequence):
+
+    def __init__(self, target, name, value, duration=.1, curve=curve.in_expo, resolution=None, time_step=None, **kwargs):
+        super().__init__(time_step=time_step, **kwargs)
+        self.target = target
+        self.name = name
+        self.start_value = getattr(target, name)
+        self.end_value = value
+        self.duration = duration
+        self.curve = curve
+        self.resolution = resolution    # set to for example 10 to only change the value in 10 steps
+
+        # precalculate the difference, so each frame is one multiply-add instead of a lerp per component
+        self._vector_type = None
+        if isinstance(self.start_value, (int, float)) and isinstance(value, (int, float)):
+            self._start, self._delta = self.start_value, value - self.start_value
+        elif isinstance(self.start_value, (LVecBase2f, LVecBase3f, LVecBase4f)) and len(value) == len(self.start_value):
+            vector = (None, None, LVecBase2f, LVecBase3f, LVecBase4f)[len(value)]
+            self._vector_type = type(self.start_value)
+            self._start = vector(*self.start_value)
+            self._delta = vector(*value) - self._start
+        else:
+            self._start = None
+
+
+    def update(self):
+        if self.paused:
+            return
+
+        if self.time_step is None:
+            self.t += time.dt * application.time_scale
+        else:
+            self.t += self.time_step * application.time_scale
+
+        t = min(self.t / self.duration, 1) if self.duration > 0 else 1
+        if self.resolution:
+            t = int(t * self.resolution) / self.resolution
+        t = self.curve(t)
+        if self._vector_type:
+            value = self._vector_type(*(self._start + self._delta * t))
+        elif self._start is not None:
+            value = self._start + self._delta * t
+        else:
+            value = lerp(self.start_value, self.end_value, t)
+        setattr(self.target, self.name, value)
+
+        if self.t >= self.duration:
+            if self.loop:
+                self.t = 0
+                return
+
+            if self.auto_destroy and self in application.sequences:
+                application.sequences.remove(self)
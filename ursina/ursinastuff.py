@@ -21,6 +21,7 @@ import time
 from pathlib import Path
 
 from ursina import application
+from ursina import timers
 from ursina.entity import Entity
 from ursina import scene
 from ursina import window
@@ -39,16 +40,13 @@ def invoke(function, *args, **kwargs):
     if 'delay' in kwargs:
         delay = kwargs['delay']
         del kwargs['delay']
+    ignore_paused = kwargs.pop('ignore_paused', False)  # keep counting down while application.paused, for menus and such
 
     if not delay:
         function(*args, **kwargs)
         return function
 
-    s = Sequence()
-    s.append(Wait(delay))
-    s.append(Func(function, *args, **kwargs))
-    s.start()
-    return s
+    return timers.call_later(delay, function, *args, ignore_paused=ignore_paused, **kwargs)  # call .cancel() on it to stop it
 
 
 def destroy(entity, delay=0):
@@ -56,10 +54,7 @@ def destroy(entity, delay=0):
         _destroy(entity)
         return
 
-    s = Sequence()
-    s.append(Wait(delay))
-    s.append(Func(_destroy, entity))
-    s.start()
+    return timers.call_later(delay, _destroy, entity)
 
 def _destroy(entity):
     if not entity:
@@ -67,6 +62,15 @@ def _destroy(entity):
         return
     if entity in scene.entities:
         scene.entities.remove(entity)
+    scene.update_registry.pop(entity, None)
+    for registry in scene.update_rate_registry.values():
+        registry.pop(entity, None)
+    scene.fixed_update_registry.pop(entity, None)
+    if hasattr(entity, '_entity_pool'):
+        entity._entity_pool._forget(entity)
+    if isinstance(entity, Entity):
+        entity._remove_from_input_registry()
+        entity._update_children_index(None)
 
     if hasattr(entity, 'on_destroy'):
         entity.on_destroy()
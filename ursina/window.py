@@ -86,7 +86,6 @@ class Window(WindowProperties):
         self.exit_button = ExitButton()
 
         from ursina import Text
-        import time
         self.fps_counter = Text(
             name = 'fps_counter',
             parent = scene.ui,
@@ -96,14 +95,10 @@ class Window(WindowProperties):
             text = '60',
             add_to_scene_entities = True,
             # background = True,
-            i = 0,
+            update_rate = 1,
             )
         def update():
-            if self.fps_counter.i > 60:
-                self.fps_counter.text = str(int(1//time.dt))
-                self.fps_counter.i = 0
-
-            self.fps_counter.i += 1
+            self.fps_counter.text = str(int(globalClock.getAverageFrameRate()))
 
         self.fps_counter.update = update
 
@@ -125,7 +120,8 @@ class Window(WindowProperties):
     def size(self, value):
         self.set_size(int(value[0]), int(value[1]))
         self.aspect_ratio = value[0] / value[1]
-        base.win.requestProperties(self)
+        if not application.headless:
+            base.win.requestProperties(self)
 
     @property
     def display_mode(self):
@@ -174,7 +170,8 @@ class Window(WindowProperties):
 
         if name == 'position':
             self.setOrigin(int(value[0]), int(value[1]))
-            application.base.win.request_properties(self)
+            if not application.headless:
+                application.base.win.request_properties(self)
             object.__setattr__(self, name, value)
 
         if name == 'fullscreen':